@@ -0,0 +1,48 @@
+#!/bin/bash
+
+# =============================================================================
+# Lambda Handler AOT Build Script (optional)
+# =============================================================================
+# Compiles the Lambda handler modules to native extensions with mypyc before
+# `terraform apply`. The compiled .so lands next to handler.py, Lambda's
+# import machinery prefers it, and the pure-Python handler.py stays in the
+# package as the fallback (and for local testing).
+#
+# Run from the repo root on a Linux x86_64 box matching the Lambda runtime
+# (python3.11). Entirely optional - skipping this script deploys the plain
+# Python handlers.
+# =============================================================================
+
+set -e
+
+GREEN='\033[0;32m'
+YELLOW='\033[1;33m'
+NC='\033[0m' # No Color
+
+HANDLER_DIRS=(
+    "terraform/modules/lambdas/policy-engine/src"
+    "terraform/modules/lambdas/notification/src"
+    "terraform/modules/lambdas/remediation-engine/src"
+    "terraform/modules/lambdas/dashboard-api/src"
+    "terraform/modules/drift-detection/src"
+)
+
+if ! python3 -c "import mypyc" 2>/dev/null; then
+    echo -e "${YELLOW}mypyc not installed (pip install mypy); deploying pure-Python handlers${NC}"
+    exit 0
+fi
+
+for dir in "${HANDLER_DIRS[@]}"; do
+    echo -e "${GREEN}Compiling ${dir}/handler.py${NC}"
+    (
+        cd "$dir"
+        # --strict would reject the boto3 dynamic types; default mode is fine
+        python3 -m mypyc handler.py || {
+            echo -e "${YELLOW}mypyc failed for ${dir}; keeping pure-Python handler${NC}"
+        }
+        # mypyc leaves build scratch behind; only the .so belongs in the zip
+        rm -rf build .mypy_cache
+    )
+done
+
+echo -e "${GREEN}Done. Run terraform apply to package the compiled handlers.${NC}"
@@ -205,6 +205,30 @@ resource "aws_api_gateway_integration" "exceptions_post" {
   uri                     = var.lambda_invoke_arn
 }
 
+# /exceptions/bulk-approve
+resource "aws_api_gateway_resource" "exceptions_bulk_approve" {
+  rest_api_id = aws_api_gateway_rest_api.governance.id
+  parent_id   = aws_api_gateway_resource.exceptions.id
+  path_part   = "bulk-approve"
+}
+
+# POST /exceptions/bulk-approve
+resource "aws_api_gateway_method" "exceptions_bulk_approve" {
+  rest_api_id   = aws_api_gateway_rest_api.governance.id
+  resource_id   = aws_api_gateway_resource.exceptions_bulk_approve.id
+  http_method   = "POST"
+  authorization = "AWS_IAM"
+}
+
+resource "aws_api_gateway_integration" "exceptions_bulk_approve" {
+  rest_api_id             = aws_api_gateway_rest_api.governance.id
+  resource_id             = aws_api_gateway_resource.exceptions_bulk_approve.id
+  http_method             = aws_api_gateway_method.exceptions_bulk_approve.http_method
+  integration_http_method = "POST"
+  type                    = "AWS_PROXY"
+  uri                     = var.lambda_invoke_arn
+}
+
 # /exceptions/{exception_id}
 resource "aws_api_gateway_resource" "exceptions_id" {
   rest_api_id = aws_api_gateway_rest_api.governance.id
@@ -301,6 +325,7 @@ resource "aws_api_gateway_deployment" "governance" {
       aws_api_gateway_method.compliance_summary_get.id,
       aws_api_gateway_method.exceptions_get.id,
       aws_api_gateway_method.exceptions_post.id,
+      aws_api_gateway_method.exceptions_bulk_approve.id,
     ]))
   }
 
@@ -314,6 +339,7 @@ resource "aws_api_gateway_deployment" "governance" {
     aws_api_gateway_integration.compliance_rules_get,
     aws_api_gateway_integration.exceptions_get,
     aws_api_gateway_integration.exceptions_post,
+    aws_api_gateway_integration.exceptions_bulk_approve,
     aws_api_gateway_integration.exceptions_delete,
     aws_api_gateway_integration.exceptions_approve,
     aws_api_gateway_integration.exceptions_reject,
@@ -103,6 +103,24 @@ resource "aws_dynamodb_table" "compliance_exceptions" {
     type = "S"
   }
 
+  # GSI for direct lookup by exception ID (approve/reject/delete endpoints)
+  attribute {
+    name = "exception_id"
+    type = "S"
+  }
+
+  # GSI for listing recent exceptions without a scan. entity_type is a
+  # constant ("EXCEPTION") so created_at gives server-side ordering.
+  attribute {
+    name = "entity_type"
+    type = "S"
+  }
+
+  attribute {
+    name = "created_at"
+    type = "S"
+  }
+
   global_secondary_index {
     name            = "status-index"
     hash_key        = "status"
@@ -110,6 +128,19 @@ resource "aws_dynamodb_table" "compliance_exceptions" {
     projection_type = "ALL"
   }
 
+  global_secondary_index {
+    name            = "exception-id-index"
+    hash_key        = "exception_id"
+    projection_type = "ALL"
+  }
+
+  global_secondary_index {
+    name            = "recent-index"
+    hash_key        = "entity_type"
+    range_key       = "created_at"
+    projection_type = "ALL"
+  }
+
   # TTL for temporary exceptions (expires_at field)
   ttl {
     attribute_name = "expires_at"
@@ -32,6 +32,7 @@ resource "aws_lambda_function" "drift_detection" {
 data "archive_file" "drift_detection" {
   type        = "zip"
   source_dir  = "${path.module}/src"
+  excludes    = ["__pycache__"]
   output_path = "${path.module}/dist/drift_detection.zip"
 }
 
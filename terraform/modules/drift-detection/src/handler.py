@@ -12,23 +12,52 @@ Flow:
 Schedule: Daily at 7pm UTC (configurable via EventBridge)
 """
 
+import gzip
 import json
 import logging
 import os
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
-from typing import Any
+from functools import lru_cache
+from typing import Any, Iterator
 
 import boto3
+from botocore.config import Config
 from botocore.exceptions import ClientError
 
+try:
+    # Optional: streams large state files one resource block at a time
+    # instead of materializing the whole parsed tree (packaged via layer)
+    import ijson
+except ImportError:
+    ijson = None
+
+try:
+    # Optional: 2-5x faster JSON parsing for the full-parse fallback
+    import orjson
+except ImportError:
+    orjson = None
+
 # Configure logging
 log_level = os.environ.get("LOG_LEVEL", "INFO")
 logger = logging.getLogger()
 logger.setLevel(getattr(logging, log_level))
 
-# AWS clients
-s3 = boto3.client("s3")
-config_client = boto3.client("config")
+# Drift checks fan out across a thread pool; size the connection pool to match
+# and let adaptive retries absorb Config API throttling.
+MAX_DRIFT_WORKERS = 16
+_BOTO_CFG = Config(
+    max_pool_connections=32,
+    retries={"mode": "adaptive", "max_attempts": 10},
+)
+
+# AWS clients (boto3 clients are thread-safe, shared across workers)
+s3 = boto3.client("s3", config=Config(
+    tcp_keepalive=True,
+    max_pool_connections=4,
+    retries={"mode": "adaptive"},
+))
+config_client = boto3.client("config", config=_BOTO_CFG)
 lambda_client = boto3.client("lambda")
 
 # Environment variables
@@ -37,29 +66,52 @@ TF_STATE_KEY = os.environ.get("TF_STATE_KEY", "governance/terraform.tfstate")
 NOTIFICATION_LAMBDA = os.environ.get("NOTIFICATION_LAMBDA", "")
 ACCOUNTS_TO_CHECK = json.loads(os.environ.get("ACCOUNTS_TO_CHECK", "[]"))
 
+# Establish the TLS session to the state bucket during INIT so the first
+# handler invocation doesn't pay client setup + handshake on its own clock
+if TF_STATE_BUCKET:
+    try:
+        s3.head_bucket(Bucket=TF_STATE_BUCKET)
+    except Exception:
+        # Warm-up only - never block startup on it
+        pass
+
 
 def lambda_handler(event: dict, context: Any) -> dict:
     """
     Main entry point for drift detection.
     Triggered by EventBridge schedule.
     """
-    logger.info(f"Starting drift detection at {datetime.now(timezone.utc).isoformat()}")
-    logger.info(f"Event: {json.dumps(event)}")
+    now_iso = datetime.now(timezone.utc).isoformat()
+    logger.info(f"Starting drift detection at {now_iso}")
+
+    # Drop any snapshots cached by a previous invocation of this container
+    _fetch_current_config.cache_clear()
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Event: %s", json.dumps(event))
     
     try:
-        # Load Terraform state
-        tf_state = load_terraform_state()
-        if not tf_state:
+        # Load Terraform state (streamed one resource block at a time)
+        resource_blocks = load_terraform_state()
+        if resource_blocks is None:
             return {"statusCode": 500, "body": "Failed to load Terraform state"}
-        
+
         # Extract managed resources from state
-        managed_resources = extract_managed_resources(tf_state)
+        managed_resources = list(iter_managed_resources(resource_blocks))
         logger.info(f"Found {len(managed_resources)} managed resources in Terraform state")
         
-        # Check each resource for drift
+        # Only resources with comparison rules and at least one comparable
+        # attribute can produce drift - skip the Config lookups for the rest
+        checkable = [r for r in managed_resources if _has_comparable_attrs(r)]
+        if len(checkable) < len(managed_resources):
+            logger.info(f"Skipping {len(managed_resources) - len(checkable)} resources with nothing to compare")
+
+        # Fetch current configurations in batches of 100, then compare
+        # in-memory - no network calls in the comparison loop
+        current_configs = batch_get_current_configs(checkable)
+
         drift_results = []
-        for resource in managed_resources:
-            drift = check_resource_drift(resource)
+        for resource in checkable:
+            drift = check_resource_drift(resource, current_configs, now_iso)
             if drift:
                 drift_results.append(drift)
         
@@ -85,21 +137,27 @@ def lambda_handler(event: dict, context: Any) -> dict:
         return {"statusCode": 500, "body": str(e)}
 
 
-def load_terraform_state() -> dict | None:
-    """Load Terraform state file from S3."""
+def load_terraform_state() -> Iterator[dict] | None:
+    """
+    Load the Terraform state file from S3.
+
+    Returns an iterator over the state's resource blocks. With ijson
+    available the S3 body is stream-parsed, so peak memory is bounded by
+    one resource block instead of the full state file.
+
+    Supports gzip-compressed state (ContentEncoding=gzip or a .gz key) -
+    JSON state compresses ~10x, so storing it gzipped cuts the S3
+    download proportionally. Decompression happens on the fly.
+    """
     if not TF_STATE_BUCKET:
         logger.error("TF_STATE_BUCKET not configured")
         return None
-    
+
     try:
         response = s3.get_object(
             Bucket=TF_STATE_BUCKET,
             Key=TF_STATE_KEY
         )
-        state = json.loads(response["Body"].read().decode("utf-8"))
-        logger.info(f"Loaded Terraform state version {state.get('version', 'unknown')}")
-        return state
-        
     except ClientError as e:
         if e.response["Error"]["Code"] == "NoSuchKey":
             logger.error(f"Terraform state not found: s3://{TF_STATE_BUCKET}/{TF_STATE_KEY}")
@@ -107,13 +165,24 @@ def load_terraform_state() -> dict | None:
             logger.error(f"Failed to load Terraform state: {e}")
         return None
 
+    body = response["Body"]
+    if response.get("ContentEncoding") == "gzip" or TF_STATE_KEY.endswith(".gz"):
+        body = gzip.GzipFile(fileobj=body)
 
-def extract_managed_resources(state: dict) -> list[dict]:
-    """Extract resource information from Terraform state."""
-    resources = []
-    
+    if ijson is not None:
+        logger.info("Streaming Terraform state with ijson")
+        return ijson.items(body, "resources.item")
+
+    raw = body.read()
+    state = orjson.loads(raw) if orjson is not None else json.loads(raw.decode("utf-8"))
+    logger.info(f"Loaded Terraform state version {state.get('version', 'unknown')}")
+    return iter(state.get("resources", []))
+
+
+def iter_managed_resources(resource_blocks: Iterator[dict]) -> Iterator[dict]:
+    """Yield resource information from Terraform state resource blocks."""
     # Terraform 1.0+ format
-    for resource_block in state.get("resources", []):
+    for resource_block in resource_blocks:
         resource_type = resource_block.get("type", "")
         resource_name = resource_block.get("name", "")
         provider = resource_block.get("provider", "")
@@ -134,127 +203,237 @@ def extract_managed_resources(state: dict) -> list[dict]:
             if not resource_id:
                 continue
             
-            resources.append({
+            yield {
                 "tf_type": resource_type,
                 "tf_name": resource_name,
                 "aws_type": aws_resource_type,
                 "resource_id": resource_id,
                 "tf_attributes": attrs
-            })
-    
-    return resources
+            }
+
+
+# Terraform resource type -> AWS Config resource type
+_TF_TO_CONFIG_TYPE = {
+    "aws_s3_bucket": "AWS::S3::Bucket",
+    "aws_security_group": "AWS::EC2::SecurityGroup",
+    "aws_instance": "AWS::EC2::Instance",
+    "aws_lambda_function": "AWS::Lambda::Function",
+    "aws_dynamodb_table": "AWS::DynamoDB::Table",
+    "aws_iam_role": "AWS::IAM::Role",
+    "aws_sns_topic": "AWS::SNS::Topic",
+    "aws_sqs_queue": "AWS::SQS::Queue",
+}
+
+# Terraform resource type -> attribute holding the resource ID
+_ID_KEYS = {
+    "aws_s3_bucket": "bucket",
+    "aws_security_group": "id",
+    "aws_instance": "id",
+    "aws_lambda_function": "function_name",
+    "aws_dynamodb_table": "name",
+    "aws_iam_role": "name",
+    "aws_sns_topic": "arn",
+    "aws_sqs_queue": "url",
+}
 
 
 def map_tf_to_config_type(tf_type: str) -> str | None:
     """Map Terraform resource type to AWS Config resource type."""
-    mapping = {
-        "aws_s3_bucket": "AWS::S3::Bucket",
-        "aws_security_group": "AWS::EC2::SecurityGroup",
-        "aws_instance": "AWS::EC2::Instance",
-        "aws_lambda_function": "AWS::Lambda::Function",
-        "aws_dynamodb_table": "AWS::DynamoDB::Table",
-        "aws_iam_role": "AWS::IAM::Role",
-        "aws_sns_topic": "AWS::SNS::Topic",
-        "aws_sqs_queue": "AWS::SQS::Queue",
-    }
-    return mapping.get(tf_type)
+    return _TF_TO_CONFIG_TYPE.get(tf_type)
 
 
 def get_resource_id(tf_type: str, attrs: dict) -> str | None:
     """Extract resource ID from Terraform attributes."""
-    id_keys = {
-        "aws_s3_bucket": "bucket",
-        "aws_security_group": "id",
-        "aws_instance": "id",
-        "aws_lambda_function": "function_name",
-        "aws_dynamodb_table": "name",
-        "aws_iam_role": "name",
-        "aws_sns_topic": "arn",
-        "aws_sqs_queue": "url",
-    }
-    key = id_keys.get(tf_type, "id")
+    key = _ID_KEYS.get(tf_type, "id")
     return attrs.get(key, attrs.get("id"))
 
 
-def check_resource_drift(resource: dict) -> dict | None:
+def batch_get_current_configs(resources: list[dict]) -> dict[tuple[str, str], dict]:
     """
-    Check if a resource has drifted from Terraform state.
-    
-    Returns drift info if drifted, None otherwise.
+    Fetch current configurations for all resources via BatchGetResourceConfig.
+
+    Returns a dict keyed by (resource_type, resource_id). Keys Config could
+    not process in the batch are retried individually in parallel.
+    """
+    configs: dict[tuple[str, str], dict] = {}
+    unprocessed: list[dict] = []
+
+    # Dedupe up front - for_each/module replication can repeat (type, id)
+    unique_keys = list({(r["aws_type"], r["resource_id"]) for r in resources})
+
+    for i in range(0, len(unique_keys), 100):
+        chunk = unique_keys[i:i + 100]
+        resource_keys = [
+            {"resourceType": rtype, "resourceId": rid}
+            for rtype, rid in chunk
+        ]
+
+        try:
+            response = config_client.batch_get_resource_config(resourceKeys=resource_keys)
+        except ClientError as e:
+            logger.error(f"Batch Config lookup failed: {e}")
+            continue
+
+        for item in response.get("baseConfigurationItems", []):
+            configs[(item["resourceType"], item["resourceId"])] = json.loads(
+                item.get("configuration") or "{}"
+            )
+
+        unprocessed.extend(response.get("unprocessedResourceKeys", []))
+
+    # Fall back to per-resource history lookups for unprocessed keys
+    if unprocessed:
+        logger.warning(f"{len(unprocessed)} resources not returned in batch, retrying individually")
+        with ThreadPoolExecutor(max_workers=MAX_DRIFT_WORKERS) as executor:
+            fetched = executor.map(
+                lambda key: _fetch_current_config(key["resourceType"], key["resourceId"]),
+                unprocessed
+            )
+            for key, config_data in zip(unprocessed, fetched):
+                if config_data is not None:
+                    configs[(key["resourceType"], key["resourceId"])] = config_data
+
+    return configs
+
+
+@lru_cache(maxsize=4096)
+def _fetch_current_config(resource_type: str, resource_id: str) -> dict | None:
+    """
+    Fetch the latest configuration for a single resource from Config history.
+
+    Cached per (resource_type, resource_id) within an invocation so repeated
+    logical instances of the same resource cost one Config call; the cache
+    is cleared at the top of lambda_handler.
     """
-    resource_type = resource["aws_type"]
-    resource_id = resource["resource_id"]
-    tf_attrs = resource["tf_attributes"]
-    
     try:
-        # Query AWS Config for current resource configuration
         response = config_client.get_resource_config_history(
             resourceType=resource_type,
             resourceId=resource_id,
             limit=1,
             chronologicalOrder="Reverse"
         )
-        
+
         items = response.get("configurationItems", [])
         if not items:
-            logger.warning(f"Resource not found in Config: {resource_type}/{resource_id}")
             return None
-        
-        current_config = items[0]
-        config_data = json.loads(current_config.get("configuration", "{}"))
-        
-        # Compare key attributes based on resource type
-        drift_details = compare_attributes(resource_type, tf_attrs, config_data)
-        
-        if drift_details:
-            return {
-                "resource_type": resource_type,
-                "resource_id": resource_id,
-                "tf_name": resource["tf_name"],
-                "drift_details": drift_details,
-                "detected_at": datetime.now(timezone.utc).isoformat()
-            }
-        
-        return None
-        
+
+        return json.loads(items[0].get("configuration") or "{}")
+
     except ClientError as e:
-        if "ResourceNotDiscoveredException" in str(e):
+        code = e.response.get("Error", {}).get("Code")
+        if code == "ResourceNotDiscoveredException":
             logger.warning(f"Resource not discovered by Config: {resource_type}/{resource_id}")
         else:
-            logger.error(f"Error checking drift for {resource_id}: {e}")
+            logger.error(f"Error fetching config for {resource_id}: {e}")
         return None
 
 
+def check_resource_drift(resource: dict, current_configs: dict[tuple[str, str], dict], now_iso: str) -> dict | None:
+    """
+    Check if a resource has drifted from Terraform state.
+
+    Pure in-memory comparison against the pre-fetched configurations.
+    Returns drift info if drifted, None otherwise.
+    """
+    resource_type = resource["aws_type"]
+    resource_id = resource["resource_id"]
+    tf_attrs = resource["tf_attributes"]
+
+    config_data = current_configs.get((resource_type, resource_id))
+    if config_data is None:
+        logger.warning(f"Resource not found in Config: {resource_type}/{resource_id}")
+        return None
+
+    # Compare key attributes based on resource type
+    drift_details = compare_attributes(resource_type, tf_attrs, config_data)
+
+    if drift_details:
+        return {
+            "resource_type": resource_type,
+            "resource_id": resource_id,
+            "tf_name": resource["tf_name"],
+            "drift_details": drift_details,
+            "detected_at": now_iso
+        }
+
+    return None
+
+
+def _values_match(tf, aws) -> bool:
+    """Direct equality comparison between Terraform and Config values."""
+    return tf == aws
+
+
+def _s3_versioning_matches(tf, aws) -> bool:
+    """S3 versioning: Terraform stores a bool, Config stores Enabled/Suspended."""
+    return (tf == True and aws == "Enabled") or (tf == False and aws != "Enabled")
+
+
+# Key attributes to check per resource type:
+# (terraform attr path, Config attr path, comparator)
+_CHECK_KEYS = {
+    "AWS::S3::Bucket": [
+        ("versioning.0.enabled", "VersioningConfiguration.Status", _s3_versioning_matches),
+    ],
+    "AWS::EC2::SecurityGroup": [
+        ("description", "description", _values_match),
+    ],
+    "AWS::Lambda::Function": [
+        ("runtime", "runtime", _values_match),
+        ("memory_size", "memorySize", _values_match),
+        ("timeout", "timeout", _values_match),
+    ],
+    "AWS::DynamoDB::Table": [
+        ("billing_mode", "billingModeSummary.billingMode", _values_match),
+    ],
+}
+
+
+def _compile_path(key_path: str) -> tuple:
+    """Pre-parse a dot-notation path into dict keys and list indices."""
+    return tuple(int(k) if k.isdigit() else k for k in key_path.split("."))
+
+
+# _CHECK_KEYS with both attribute paths pre-compiled, so the comparison
+# loop does no string splitting or digit parsing per resource
+_COMPILED_CHECK_KEYS = {
+    rtype: [
+        (tf_key, _compile_path(tf_key), _compile_path(aws_key), compare_fn)
+        for tf_key, aws_key, compare_fn in checks
+    ]
+    for rtype, checks in _CHECK_KEYS.items()
+}
+
+
+def _has_comparable_attrs(resource: dict) -> bool:
+    """
+    Whether a drift check on this resource could produce any diff.
+
+    False when no comparison rules exist for the resource type, or when
+    every comparable Terraform attribute is unset - either way the Config
+    lookup would be wasted.
+    """
+    checks = _COMPILED_CHECK_KEYS.get(resource["aws_type"])
+    if not checks:
+        return False
+
+    tf_attrs = resource["tf_attributes"]
+    return any(
+        get_nested_value(tf_attrs, tf_path) is not None
+        for _, tf_path, _, _ in checks
+    )
+
+
 def compare_attributes(resource_type: str, tf_attrs: dict, config_data: dict) -> list[dict]:
     """Compare Terraform attributes with AWS Config data."""
     diffs = []
-    
-    # Define key attributes to check per resource type
-    check_keys = {
-        "AWS::S3::Bucket": [
-            ("versioning.0.enabled", "VersioningConfiguration.Status", 
-             lambda tf, aws: (tf == True and aws == "Enabled") or (tf == False and aws != "Enabled")),
-        ],
-        "AWS::EC2::SecurityGroup": [
-            ("description", "description", lambda tf, aws: tf == aws),
-        ],
-        "AWS::Lambda::Function": [
-            ("runtime", "runtime", lambda tf, aws: tf == aws),
-            ("memory_size", "memorySize", lambda tf, aws: tf == aws),
-            ("timeout", "timeout", lambda tf, aws: tf == aws),
-        ],
-        "AWS::DynamoDB::Table": [
-            ("billing_mode", "billingModeSummary.billingMode", 
-             lambda tf, aws: tf == aws or (tf == "PAY_PER_REQUEST" and aws == "PAY_PER_REQUEST")),
-        ],
-    }
-    
-    keys_to_check = check_keys.get(resource_type, [])
-    
-    for tf_key, aws_key, compare_fn in keys_to_check:
-        tf_value = get_nested_value(tf_attrs, tf_key)
-        aws_value = get_nested_value(config_data, aws_key)
-        
+
+    keys_to_check = _COMPILED_CHECK_KEYS.get(resource_type, [])
+
+    for tf_key, tf_path, aws_path, compare_fn in keys_to_check:
+        tf_value = get_nested_value(tf_attrs, tf_path)
+        aws_value = get_nested_value(config_data, aws_path)
+
         if tf_value is not None and aws_value is not None:
             if not compare_fn(tf_value, aws_value):
                 diffs.append({
@@ -262,27 +441,25 @@ def compare_attributes(resource_type: str, tf_attrs: dict, config_data: dict) ->
                     "terraform_value": str(tf_value),
                     "actual_value": str(aws_value)
                 })
-    
+
     return diffs
 
 
-def get_nested_value(data: dict, key_path: str) -> Any:
-    """Get nested value from dict using dot notation."""
-    keys = key_path.split(".")
+def get_nested_value(data: dict, path: tuple) -> Any:
+    """Get nested value using a pre-compiled path of dict keys and list indices."""
     value = data
-    
-    for key in keys:
-        if isinstance(value, dict):
+
+    for key in path:
+        if isinstance(key, int):
+            value = value[key] if isinstance(value, list) and key < len(value) else None
+        elif isinstance(value, dict):
             value = value.get(key)
-        elif isinstance(value, list) and key.isdigit():
-            idx = int(key)
-            value = value[idx] if idx < len(value) else None
         else:
             return None
-        
+
         if value is None:
             return None
-    
+
     return value
 
 
@@ -292,19 +469,24 @@ def send_drift_alert(drift_results: list[dict]) -> None:
         logger.warning("Notification Lambda not configured")
         return
     
-    # Build alert message
-    message = "🔄 **Terraform Drift Detected**\n\n"
-    message += f"Detected {len(drift_results)} resources with configuration drift:\n\n"
-    
+    # Build alert message (list append + join avoids quadratic string concat)
+    parts = [
+        "🔄 **Terraform Drift Detected**\n\n",
+        f"Detected {len(drift_results)} resources with configuration drift:\n\n",
+    ]
+
     for drift in drift_results[:10]:  # Limit to first 10
-        message += f"• **{drift['resource_type']}**: `{drift['resource_id']}`\n"
-        for detail in drift.get("drift_details", []):
-            message += f"  - {detail['attribute']}: TF=`{detail['terraform_value']}` vs Actual=`{detail['actual_value']}`\n"
-    
+        parts.append(f"• **{drift['resource_type']}**: `{drift['resource_id']}`\n")
+        parts.extend(
+            f"  - {detail['attribute']}: TF=`{detail['terraform_value']}` vs Actual=`{detail['actual_value']}`\n"
+            for detail in drift.get("drift_details", [])
+        )
+
     if len(drift_results) > 10:
-        message += f"\n...and {len(drift_results) - 10} more.\n"
-    
-    message += "\n⚠️ Run `terraform plan` to see full drift and `terraform apply` to reconcile."
+        parts.append(f"\n...and {len(drift_results) - 10} more.\n")
+
+    parts.append("\n⚠️ Run `terraform plan` to see full drift and `terraform apply` to reconcile.")
+    message = "".join(parts)
     
     payload = {
         "action": "notify",
@@ -99,6 +99,7 @@ data "aws_iam_policy_document" "remediation_actions" {
     effect = "Allow"
     actions = [
       "ec2:DescribeSecurityGroups",
+      "ec2:DescribeSecurityGroupRules",
       "ec2:RevokeSecurityGroupIngress"
     ]
     resources = ["*"]
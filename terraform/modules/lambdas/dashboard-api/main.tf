@@ -31,6 +31,7 @@ resource "aws_lambda_function" "dashboard_api" {
 data "archive_file" "dashboard_api" {
   type        = "zip"
   source_dir  = "${path.module}/src"
+  excludes    = ["__pycache__"]
   output_path = "${path.module}/dist/dashboard_api.zip"
 }
 
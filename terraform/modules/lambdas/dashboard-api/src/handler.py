@@ -9,6 +9,7 @@ Endpoints:
 - GET /compliance/rules/{name} - Violations by rule
 - GET /exceptions - List all exceptions
 - POST /exceptions - Create exception request (pending approval)
+- POST /exceptions/bulk-approve - Approve a batch of exceptions
 - PUT /exceptions/{id}/approve - Approve exception
 - PUT /exceptions/{id}/reject - Reject exception
 - DELETE /exceptions/{id} - Delete exception
@@ -19,13 +20,22 @@ import logging
 import os
 import time
 import uuid
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from decimal import Decimal
 from typing import Any
 
 import boto3
+from boto3.dynamodb.conditions import Attr, Key
 from botocore.exceptions import ClientError
 
+try:
+    # Optional: ~3x faster response serialization (packaged via layer)
+    import orjson
+except ImportError:
+    orjson = None
+
 # Configure logging
 log_level = os.environ.get("LOG_LEVEL", "INFO")
 logger = logging.getLogger()
@@ -38,6 +48,26 @@ dynamodb = boto3.resource("dynamodb")
 COMPLIANCE_TABLE = os.environ.get("COMPLIANCE_TABLE", "")
 EXCEPTIONS_TABLE = os.environ.get("EXCEPTIONS_TABLE", "")
 
+# Parallelism for the compliance summary aggregation scan
+SUMMARY_SCAN_SEGMENTS = 8
+
+# Pre-built condition objects, reused across requests so boto3 does not
+# re-parse the expression strings per call
+_NON_COMPLIANT_FILTER = Attr("compliance_type").eq("NON_COMPLIANT")
+_EXCEPTION_ENTITY_COND = Key("entity_type").eq("EXCEPTION")
+
+# Table handles are cached per container - constructing a Table resource
+# per request is pure overhead on warm invocations
+_COMPLIANCE_TABLE = dynamodb.Table(COMPLIANCE_TABLE) if COMPLIANCE_TABLE else None
+_EXCEPTIONS_TABLE = dynamodb.Table(EXCEPTIONS_TABLE) if EXCEPTIONS_TABLE else None
+
+
+def _decimal_default(obj):
+    """Convert DynamoDB Decimal values to plain ints/floats."""
+    if isinstance(obj, Decimal):
+        return int(obj) if obj % 1 == 0 else float(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
 
 class DecimalEncoder(json.JSONEncoder):
     """Handle Decimal types from DynamoDB."""
@@ -51,7 +81,8 @@ def lambda_handler(event: dict, context: Any) -> dict:
     """
     Main entry point for API Gateway requests.
     """
-    logger.info(f"Received event: {json.dumps(event)}")
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Received event: %s", json.dumps(event))
     
     http_method = event.get("httpMethod", "")
     path = event.get("path", "")
@@ -84,6 +115,9 @@ def lambda_handler(event: dict, context: Any) -> dict:
         
         elif path == "/exceptions" and http_method == "POST":
             return create_exception(body_data)
+
+        elif path == "/exceptions/bulk-approve" and http_method == "POST":
+            return bulk_approve_exceptions(body_data)
         
         elif path.startswith("/exceptions/") and "/approve" in path and http_method == "PUT":
             exception_id = path_params.get("exception_id", "")
@@ -115,7 +149,11 @@ def response(status_code: int, body: dict) -> dict:
             "Access-Control-Allow-Methods": "GET, POST, PUT, DELETE, OPTIONS",
             "Access-Control-Allow-Headers": "Content-Type, Authorization"
         },
-        "body": json.dumps(body, cls=DecimalEncoder)
+        "body": (
+            orjson.dumps(body, default=_decimal_default).decode()
+            if orjson is not None
+            else json.dumps(body, cls=DecimalEncoder)
+        )
     }
 
 
@@ -123,43 +161,73 @@ def response(status_code: int, body: dict) -> dict:
 # Compliance Endpoints
 # =============================================================================
 
+def _scan_summary_segment(table, segment: int) -> tuple[int, dict, dict]:
+    """
+    Aggregate one segment of the compliance index.
+
+    Follows LastEvaluatedKey to the end of the segment and folds each page
+    into the counters as it arrives, so memory stays bounded by one page.
+    """
+    by_account = Counter()
+    by_rule = Counter()
+    total = 0
+
+    scan_kwargs = {
+        "IndexName": "compliance-index",
+        "FilterExpression": _NON_COMPLIANT_FILTER,
+        "Select": "SPECIFIC_ATTRIBUTES",
+        "ProjectionExpression": "account_id, rule_name",
+        "Segment": segment,
+        "TotalSegments": SUMMARY_SCAN_SEGMENTS,
+    }
+
+    while True:
+        result = table.scan(**scan_kwargs)
+
+        for item in result.get("Items", []):
+            total += 1
+            by_account[item.get("account_id", "unknown")] += 1
+            by_rule[item.get("rule_name", "unknown")] += 1
+
+        last_key = result.get("LastEvaluatedKey")
+        if not last_key:
+            return total, by_account, by_rule
+        scan_kwargs["ExclusiveStartKey"] = last_key
+
+
 def get_compliance_summary() -> dict:
     """Get org-wide compliance summary."""
     if not COMPLIANCE_TABLE:
         return response(500, {"error": "Compliance table not configured"})
-    
-    table = dynamodb.Table(COMPLIANCE_TABLE)
-    
-    # Scan with filter for recent records (last 24 hours)
-    cutoff = datetime.now(timezone.utc).isoformat()[:10]  # Today's date
-    
+
+    table = _COMPLIANCE_TABLE
+
     try:
-        # Get all NON_COMPLIANT records
-        non_compliant = table.query(
-            IndexName="compliance-index",
-            KeyConditionExpression="compliance_type = :ct",
-            ExpressionAttributeValues={":ct": "NON_COMPLIANT"},
-            Limit=1000
-        )
-        
-        # Aggregate by account and rule
-        by_account = {}
-        by_rule = {}
-        
-        for item in non_compliant.get("Items", []):
-            account = item.get("account_id", "unknown")
-            rule = item.get("rule_name", "unknown")
-            
-            by_account[account] = by_account.get(account, 0) + 1
-            by_rule[rule] = by_rule.get(rule, 0) + 1
-        
+        # Fan the aggregation scan out across segments; only project the
+        # two attributes we aggregate on to keep the payload small
+        with ThreadPoolExecutor(max_workers=SUMMARY_SCAN_SEGMENTS) as executor:
+            segments = executor.map(
+                lambda s: _scan_summary_segment(table, s),
+                range(SUMMARY_SCAN_SEGMENTS)
+            )
+
+        # Merge the per-segment aggregates (Counter.update adds counts)
+        by_account = Counter()
+        by_rule = Counter()
+        total = 0
+
+        for seg_total, seg_by_account, seg_by_rule in segments:
+            total += seg_total
+            by_account.update(seg_by_account)
+            by_rule.update(seg_by_rule)
+
         return response(200, {
-            "total_violations": len(non_compliant.get("Items", [])),
-            "by_account": by_account,
-            "by_rule": by_rule,
+            "total_violations": total,
+            "by_account": dict(by_account),
+            "by_rule": dict(by_rule),
             "generated_at": datetime.now(timezone.utc).isoformat()
         })
-        
+
     except ClientError as e:
         logger.error(f"DynamoDB error: {e}")
         return response(500, {"error": "Database error"})
@@ -173,16 +241,12 @@ def get_account_compliance(account_id: str) -> dict:
     if not account_id:
         return response(400, {"error": "account_id is required"})
     
-    table = dynamodb.Table(COMPLIANCE_TABLE)
+    table = _COMPLIANCE_TABLE
     
     try:
         # Query by account ID prefix
         result = table.scan(
-            FilterExpression="account_id = :aid AND compliance_type = :ct",
-            ExpressionAttributeValues={
-                ":aid": account_id,
-                ":ct": "NON_COMPLIANT"
-            },
+            FilterExpression=Attr("account_id").eq(account_id) & _NON_COMPLIANT_FILTER,
             Limit=100
         )
         
@@ -205,17 +269,13 @@ def get_rule_violations(rule_name: str) -> dict:
     if not rule_name:
         return response(400, {"error": "rule_name is required"})
     
-    table = dynamodb.Table(COMPLIANCE_TABLE)
+    table = _COMPLIANCE_TABLE
     
     try:
         result = table.query(
             IndexName="rule-index",
-            KeyConditionExpression="rule_name = :rn",
-            FilterExpression="compliance_type = :ct",
-            ExpressionAttributeValues={
-                ":rn": rule_name,
-                ":ct": "NON_COMPLIANT"
-            },
+            KeyConditionExpression=Key("rule_name").eq(rule_name),
+            FilterExpression=_NON_COMPLIANT_FILTER,
             Limit=100
         )
         
@@ -239,17 +299,22 @@ def list_exceptions(status_filter: str = "") -> dict:
     if not EXCEPTIONS_TABLE:
         return response(500, {"error": "Exceptions table not configured"})
     
-    table = dynamodb.Table(EXCEPTIONS_TABLE)
+    table = _EXCEPTIONS_TABLE
     
     try:
         if status_filter:
             result = table.query(
                 IndexName="status-index",
-                KeyConditionExpression="status = :s",
-                ExpressionAttributeValues={":s": status_filter}
+                KeyConditionExpression=Key("status").eq(status_filter)
             )
         else:
-            result = table.scan(Limit=100)
+            # Most recent exceptions first, served by the index - no scan
+            result = table.query(
+                IndexName="recent-index",
+                KeyConditionExpression=_EXCEPTION_ENTITY_COND,
+                ScanIndexForward=False,
+                Limit=100
+            )
         
         return response(200, {
             "exceptions": result.get("Items", []),
@@ -271,7 +336,7 @@ def create_exception(data: dict) -> dict:
     if missing:
         return response(400, {"error": f"Missing required fields: {missing}"})
     
-    table = dynamodb.Table(EXCEPTIONS_TABLE)
+    table = _EXCEPTIONS_TABLE
     
     pk = f"EXCEPTION#{data['account_id']}#{data['resource_id']}"
     sk = f"RULE#{data['rule_name']}"
@@ -285,6 +350,7 @@ def create_exception(data: dict) -> dict:
         "pk": pk,
         "sk": sk,
         "exception_id": str(uuid.uuid4()),
+        "entity_type": "EXCEPTION",  # Constant partition key for recent-index
         "account_id": data["account_id"],
         "resource_id": data["resource_id"],
         "rule_name": data["rule_name"],
@@ -311,6 +377,95 @@ def create_exception(data: dict) -> dict:
         return response(500, {"error": "Database error"})
 
 
+def bulk_approve_exceptions(data: dict) -> dict:
+    """Approve a batch of exception requests in one transactional sweep."""
+    if not EXCEPTIONS_TABLE:
+        return response(500, {"error": "Exceptions table not configured"})
+
+    exception_ids = data.get("exception_ids") or []
+    if not exception_ids:
+        return response(400, {"error": "exception_ids is required"})
+
+    approved_by = data.get("approved_by", "")
+    if not approved_by:
+        return response(400, {"error": "approved_by is required"})
+
+    return _bulk_update_exception_status(exception_ids, "approved", approved_by)
+
+
+def _lookup_exception_key(exception_id: str) -> tuple[str, str] | None:
+    """Resolve an exception_id to its (pk, sk) via the exception-id GSI."""
+    result = _EXCEPTIONS_TABLE.query(
+        IndexName="exception-id-index",
+        KeyConditionExpression=Key("exception_id").eq(exception_id),
+        Limit=1
+    )
+
+    items = result.get("Items", [])
+    if not items:
+        return None
+    return items[0]["pk"], items[0]["sk"]
+
+
+def _bulk_update_exception_status(exception_ids: list[str], new_status: str, updated_by: str) -> dict:
+    """
+    Update a batch of exceptions in chunks of up to 100 per transaction.
+
+    Key lookups fan out across a thread pool; the updates themselves go
+    through TransactWriteItems so each chunk is a single API call.
+    """
+    # Duplicate ids would produce two Updates on the same key in one
+    # transaction, which DynamoDB rejects; dedupe preserving order
+    exception_ids = list(dict.fromkeys(exception_ids))
+
+    try:
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            keys = list(executor.map(_lookup_exception_key, exception_ids))
+
+        found = [key for key in keys if key]
+        not_found = [eid for eid, key in zip(exception_ids, keys) if not key]
+
+        now_iso = datetime.now(timezone.utc).isoformat()
+        client = dynamodb.meta.client
+
+        for i in range(0, len(found), 100):
+            chunk = found[i:i + 100]
+            client.transact_write_items(TransactItems=[
+                {
+                    "Update": {
+                        "TableName": EXCEPTIONS_TABLE,
+                        "Key": {"pk": {"S": pk}, "sk": {"S": sk}},
+                        "UpdateExpression": (
+                            "SET #status = :status, updated_at = :updated_at, "
+                            "updated_by = :updated_by, approved_by = :updated_by, "
+                            "approved_at = :updated_at"
+                        ),
+                        "ExpressionAttributeNames": {"#status": "status"},
+                        "ExpressionAttributeValues": {
+                            ":status": {"S": new_status},
+                            ":updated_at": {"S": now_iso},
+                            ":updated_by": {"S": updated_by}
+                        }
+                    }
+                }
+                for pk, sk in chunk
+            ])
+
+        result = {
+            "message": f"{len(found)} exception(s) {new_status}",
+            "updated": len(found),
+            "status": new_status
+        }
+        if not_found:
+            result["not_found"] = not_found
+
+        return response(200, result)
+
+    except ClientError as e:
+        logger.error(f"DynamoDB error: {e}")
+        return response(500, {"error": "Database error"})
+
+
 def approve_exception(exception_id: str, data: dict) -> dict:
     """Approve an exception request."""
     if not EXCEPTIONS_TABLE:
@@ -336,13 +491,14 @@ def reject_exception(exception_id: str, data: dict) -> dict:
 
 def _update_exception_status(exception_id: str, new_status: str, updated_by: str, reason: str = "") -> dict:
     """Update exception status (approve/reject)."""
-    table = dynamodb.Table(EXCEPTIONS_TABLE)
-    
-    # Find the exception by ID (scan required since exception_id is not a key)
+    table = _EXCEPTIONS_TABLE
+
+    # Look up the exception by ID via the dedicated GSI
     try:
-        result = table.scan(
-            FilterExpression="exception_id = :eid",
-            ExpressionAttributeValues={":eid": exception_id}
+        result = table.query(
+            IndexName="exception-id-index",
+            KeyConditionExpression=Key("exception_id").eq(exception_id),
+            Limit=1
         )
         
         items = result.get("Items", [])
@@ -353,17 +509,19 @@ def _update_exception_status(exception_id: str, new_status: str, updated_by: str
         pk = item["pk"]
         sk = item["sk"]
         
+        now_iso = datetime.now(timezone.utc).isoformat()
+
         update_expr = "SET #status = :status, updated_at = :updated_at, updated_by = :updated_by"
         expr_values = {
             ":status": new_status,
-            ":updated_at": datetime.now(timezone.utc).isoformat(),
+            ":updated_at": now_iso,
             ":updated_by": updated_by
         }
-        
+
         if new_status == "approved":
             update_expr += ", approved_by = :approved_by, approved_at = :approved_at"
             expr_values[":approved_by"] = updated_by
-            expr_values[":approved_at"] = datetime.now(timezone.utc).isoformat()
+            expr_values[":approved_at"] = now_iso
         elif new_status == "rejected" and reason:
             update_expr += ", rejection_reason = :rejection_reason"
             expr_values[":rejection_reason"] = reason
@@ -391,13 +549,14 @@ def delete_exception(exception_id: str) -> dict:
     if not EXCEPTIONS_TABLE:
         return response(500, {"error": "Exceptions table not configured"})
     
-    table = dynamodb.Table(EXCEPTIONS_TABLE)
+    table = _EXCEPTIONS_TABLE
     
     try:
-        # Find and delete
-        result = table.scan(
-            FilterExpression="exception_id = :eid",
-            ExpressionAttributeValues={":eid": exception_id}
+        # Find and delete via the exception-id GSI
+        result = table.query(
+            IndexName="exception-id-index",
+            KeyConditionExpression=Key("exception_id").eq(exception_id),
+            Limit=1
         )
         
         items = result.get("Items", [])
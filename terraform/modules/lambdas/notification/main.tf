@@ -30,6 +30,7 @@ resource "aws_lambda_function" "notification" {
 data "archive_file" "notification" {
   type        = "zip"
   source_dir  = "${path.module}/src"
+  excludes    = ["__pycache__"]
   output_path = "${path.module}/dist/notification.zip"
 }
 
@@ -68,3 +69,35 @@ data "aws_iam_policy_document" "sns_publish" {
     resources = [var.sns_topic_arn]
   }
 }
+
+# Buffer queue trigger for batched notification delivery (optional)
+resource "aws_lambda_event_source_mapping" "notification_queue" {
+  count = var.notification_queue_arn != "" ? 1 : 0
+
+  event_source_arn                   = var.notification_queue_arn
+  function_name                      = aws_lambda_function.notification.arn
+  batch_size                         = 10
+  maximum_batching_window_in_seconds = 30
+}
+
+resource "aws_iam_role_policy" "notification_queue" {
+  count = var.notification_queue_arn != "" ? 1 : 0
+
+  name   = "${var.name_prefix}-notification-queue"
+  role   = aws_iam_role.notification.id
+  policy = data.aws_iam_policy_document.notification_queue[0].json
+}
+
+data "aws_iam_policy_document" "notification_queue" {
+  count = var.notification_queue_arn != "" ? 1 : 0
+
+  statement {
+    effect = "Allow"
+    actions = [
+      "sqs:ReceiveMessage",
+      "sqs:DeleteMessage",
+      "sqs:GetQueueAttributes"
+    ]
+    resources = [var.notification_queue_arn]
+  }
+}
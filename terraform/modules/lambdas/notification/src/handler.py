@@ -9,14 +9,23 @@ Features:
 - Formatted messages with account, resource, and rule info
 """
 
+import base64
+import copy
+import gzip
 import json
 import logging
 import os
 from typing import Any
-from urllib.request import Request, urlopen
-from urllib.error import URLError, HTTPError
+from urllib.parse import urlsplit
 
-import boto3
+import urllib3
+from botocore.config import Config
+
+# orjson arrives via a Lambda layer; serialization falls back to stdlib json
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 logger = logging.getLogger()
 logger.setLevel(logging.INFO)
@@ -26,7 +35,43 @@ SNS_TOPIC_ARN = os.environ.get("SNS_TOPIC_ARN")
 SLACK_WEBHOOK_URL = os.environ.get("SLACK_WEBHOOK_URL", "")
 ENABLE_SLACK = os.environ.get("ENABLE_SLACK", "false").lower() == "true"
 
-SNS_CLIENT = boto3.client("sns")
+# Keep-alive so warm invocations reuse the SNS TLS connection
+_BOTO_CFG = Config(
+    tcp_keepalive=True,
+    max_pool_connections=50,
+    retries={"mode": "standard", "max_attempts": 3},
+    connect_timeout=2,
+    read_timeout=5,
+)
+
+# The SNS client is built lazily so Slack-only deployments never pay the
+# boto3 import and client construction cost on cold start
+_SNS_CLIENT = None
+
+
+def _get_sns():
+    """Return the shared SNS client, constructing it on first use."""
+    global _SNS_CLIENT
+    if _SNS_CLIENT is None:
+        import boto3
+
+        _SNS_CLIENT = boto3.client("sns", config=_BOTO_CFG)
+    return _SNS_CLIENT
+
+
+# Pooled HTTPS connection to the Slack host so warm invocations skip the
+# TLS handshake (urllib3 ships with the Lambda runtime via botocore)
+if SLACK_WEBHOOK_URL:
+    _SLACK_PARTS = urlsplit(SLACK_WEBHOOK_URL)
+    _SLACK_POOL = urllib3.HTTPSConnectionPool(
+        _SLACK_PARTS.netloc,
+        maxsize=4,
+        retries=urllib3.Retry(total=2, backoff_factor=0.2),
+        timeout=urllib3.Timeout(connect=2.0, read=5.0),
+    )
+else:
+    _SLACK_PARTS = None
+    _SLACK_POOL = None
 
 # Severity color mapping for Slack
 SEVERITY_COLORS = {
@@ -38,18 +83,92 @@ SEVERITY_COLORS = {
 # Severity emoji for Slack
 SEVERITY_EMOJI = {
     "LOW": "🟢",
-    "MEDIUM": "🟠", 
+    "MEDIUM": "🟠",
     "HIGH": "🔴",
 }
 
+# Static message scaffolding built once per container instead of per call
+_SNS_TEMPLATE = (
+    "AWS Config Rule Violation Detected\n"
+    "----------------------------------\n"
+    "Severity: {severity}\n"
+    "Rule: {rule_name}\n"
+    "Account: {account_id}\n"
+    "Region: {region}\n"
+    "Resource Type: {resource_type}\n"
+    "Resource: {resource_id}\n"
+)
+
+# severity -> (Slack action field, SNS message tail)
+_ACTION_BY_SEVERITY = {
+    "LOW": (
+        "✅ Auto-remediation was attempted",
+        "\nAction: Auto-remediation was attempted.",
+    ),
+    "MEDIUM": (
+        "⚠️ Manual review recommended",
+        "\nAction Required: Review and remediate manually if needed.",
+    ),
+    "HIGH": (
+        "🚨 Immediate manual intervention required",
+        "\nAction Required: Immediate manual review required.",
+    ),
+}
+_DEFAULT_ACTION = _ACTION_BY_SEVERITY["HIGH"]
+
+# Field scaffolding for the Slack attachment: titles and layout are fixed,
+# only the values change per call
+_FIELD_TEMPLATE = (
+    {"title": "Severity", "value": None, "short": True},
+    {"title": "Account", "value": None, "short": True},
+    {"title": "Region", "value": None, "short": True},
+    {"title": "Resource Type", "value": None, "short": True},
+    {"title": "Resource ID", "value": None, "short": False},
+)
+
+# Slack attachment skeleton; deep-copied per call and only the dynamic
+# fields are patched in
+_SLACK_SKELETON = {
+    "attachments": [
+        {
+            "color": "#808080",
+            "pretext": "",
+            "title": "",
+            "fields": [],
+            "footer": "Cloud Governance Platform",
+            "footer_icon": "https://a.slack-edge.com/80588/img/services/outgoing-webhook_48.png",
+        }
+    ]
+}
+
 
 def lambda_handler(event: dict, context: Any) -> dict:
     """
     Main entry point for notification processing.
     Sends notifications to both SNS and Slack (if configured).
     """
-    logger.info(f"Received notification request: {json.dumps(event)}")
-    
+    # Serializing the full event is wasted work unless DEBUG is on
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Received notification request: %s", json.dumps(event))
+
+    # SQS trigger: each record body is one buffered notification payload
+    records = event.get("Records")
+    if records:
+        results = [_process_notification(json.loads(record["body"])) for record in records]
+        return {"statusCode": 200, "body": json.dumps({"processed": len(results)})}
+
+    result = _process_notification(event)
+    return {"statusCode": 200, "body": json.dumps(result)}
+
+
+def _process_notification(event: dict) -> dict:
+    """
+    Send SNS/Slack notifications for a single notification payload.
+    """
+    # Large senders gzip the payload to stay under the async invoke cap
+    if event.get("compressed"):
+        event = json.loads(gzip.decompress(base64.b64decode(event["data"])))
+
     compliance_data = event.get("compliance_data", {})
     account_id = compliance_data.get("account_id", "Unknown")
     rule_name = compliance_data.get("rule_name", "Unknown")
@@ -59,17 +178,19 @@ def lambda_handler(event: dict, context: Any) -> dict:
     resource_type = compliance_data.get("resource_type", "Unknown")
     annotation = compliance_data.get("annotation", "")
     
-    # Send SNS notification
-    sns_result = send_sns_notification(
-        severity=severity,
-        rule_name=rule_name,
-        account_id=account_id,
-        resource_id=resource_id,
-        region=region,
-        resource_type=resource_type,
-        annotation=annotation
-    )
-    
+    # Send SNS notification (skipped entirely on Slack-only deployments)
+    sns_result = None
+    if SNS_TOPIC_ARN:
+        sns_result = send_sns_notification(
+            severity=severity,
+            rule_name=rule_name,
+            account_id=account_id,
+            resource_id=resource_id,
+            region=region,
+            resource_type=resource_type,
+            annotation=annotation
+        )
+
     # Send Slack notification if enabled
     slack_result = None
     if ENABLE_SLACK and SLACK_WEBHOOK_URL:
@@ -82,13 +203,10 @@ def lambda_handler(event: dict, context: Any) -> dict:
             resource_type=resource_type,
             annotation=annotation
         )
-    
+
     return {
-        "statusCode": 200,
-        "body": json.dumps({
-            "sns": sns_result,
-            "slack": slack_result
-        })
+        "sns": sns_result,
+        "slack": slack_result
     }
 
 
@@ -105,31 +223,23 @@ def send_sns_notification(
     Format and send notification via SNS.
     """
     subject = f"[{severity}] Config Rule Violation: {rule_name}"
-    message = (
-        f"AWS Config Rule Violation Detected\n"
-        f"----------------------------------\n"
-        f"Severity: {severity}\n"
-        f"Rule: {rule_name}\n"
-        f"Account: {account_id}\n"
-        f"Region: {region}\n"
-        f"Resource Type: {resource_type}\n"
-        f"Resource: {resource_id}\n"
+    message = _SNS_TEMPLATE.format(
+        severity=severity,
+        rule_name=rule_name,
+        account_id=account_id,
+        region=region,
+        resource_type=resource_type,
+        resource_id=resource_id,
     )
-    
+
     if annotation:
         message += f"\nDetails: {annotation}\n"
-    
-    if severity == "LOW":
-        message += "\nAction: Auto-remediation was attempted."
-    elif severity == "MEDIUM":
-        message += "\nAction Required: Review and remediate manually if needed."
-    else:
-        message += "\nAction Required: Immediate manual review required."
-    
+
+    message += _ACTION_BY_SEVERITY.get(severity, _DEFAULT_ACTION)[1]
     message += "\n\n--\nCloud Governance Platform"
     
     try:
-        SNS_CLIENT.publish(
+        _get_sns().publish(
             TopicArn=SNS_TOPIC_ARN,
             Subject=subject[:100],  # Max 100 chars for email subject
             Message=message
@@ -137,7 +247,7 @@ def send_sns_notification(
         logger.info("SNS notification sent successfully")
         return "sent"
     except Exception as e:
-        logger.error(f"Failed to send SNS notification: {e}")
+        logger.error("Failed to send SNS notification: %s", e)
         return f"failed: {str(e)}"
 
 
@@ -156,54 +266,22 @@ def send_slack_notification(
     """
     emoji = SEVERITY_EMOJI.get(severity, "⚪")
     color = SEVERITY_COLORS.get(severity, "#808080")
-    
-    # Build action text based on severity
-    if severity == "LOW":
-        action_text = "✅ Auto-remediation was attempted"
-    elif severity == "MEDIUM":
-        action_text = "⚠️ Manual review recommended"
-    else:
-        action_text = "🚨 Immediate manual intervention required"
-    
-    # Slack payload with attachment for rich formatting
-    payload = {
-        "attachments": [
-            {
-                "color": color,
-                "pretext": f"{emoji} *AWS Config Rule Violation Detected*",
-                "title": f"Rule: {rule_name}",
-                "fields": [
-                    {
-                        "title": "Severity",
-                        "value": severity,
-                        "short": True
-                    },
-                    {
-                        "title": "Account",
-                        "value": account_id,
-                        "short": True
-                    },
-                    {
-                        "title": "Region",
-                        "value": region,
-                        "short": True
-                    },
-                    {
-                        "title": "Resource Type",
-                        "value": resource_type,
-                        "short": True
-                    },
-                    {
-                        "title": "Resource ID",
-                        "value": f"`{resource_id}`",
-                        "short": False
-                    }
-                ],
-                "footer": "Cloud Governance Platform",
-                "footer_icon": "https://a.slack-edge.com/80588/img/services/outgoing-webhook_48.png"
-            }
-        ]
-    }
+    action_text = _ACTION_BY_SEVERITY.get(severity, _DEFAULT_ACTION)[0]
+
+    # Slack payload with attachment for rich formatting; only the dynamic
+    # parts are filled in, the skeleton is prebuilt at import
+    payload = copy.deepcopy(_SLACK_SKELETON)
+    attachment = payload["attachments"][0]
+    attachment["color"] = color
+    attachment["pretext"] = f"{emoji} *AWS Config Rule Violation Detected*"
+    attachment["title"] = f"Rule: {rule_name}"
+    fields = [dict(t) for t in _FIELD_TEMPLATE]
+    fields[0]["value"] = severity
+    fields[1]["value"] = account_id
+    fields[2]["value"] = region
+    fields[3]["value"] = resource_type
+    fields[4]["value"] = f"`{resource_id}`"
+    attachment["fields"] = fields
     
     # Add annotation if present
     if annotation:
@@ -221,23 +299,30 @@ def send_slack_notification(
     })
     
     try:
-        request = Request(
-            SLACK_WEBHOOK_URL,
-            data=json.dumps(payload).encode("utf-8"),
-            headers={"Content-Type": "application/json"}
+        body = (
+            orjson.dumps(payload)
+            if orjson is not None
+            else json.dumps(payload).encode("utf-8")
+        )
+        response = _SLACK_POOL.urlopen(
+            "POST",
+            _SLACK_PARTS.path,
+            body=body,
+            headers={"Content-Type": "application/json"},
         )
-        
-        with urlopen(request, timeout=10) as response:
-            response_body = response.read().decode("utf-8")
-            logger.info(f"Slack notification sent successfully: {response_body}")
-            return "sent"
-            
-    except HTTPError as e:
-        logger.error(f"Slack HTTP error: {e.code} - {e.read().decode('utf-8')}")
-        return f"failed: HTTP {e.code}"
-    except URLError as e:
-        logger.error(f"Slack URL error: {e.reason}")
-        return f"failed: {str(e.reason)}"
+
+        if response.status >= 400:
+            logger.error(
+                f"Slack HTTP error: {response.status} - {response.data.decode('utf-8')}"
+            )
+            return f"failed: HTTP {response.status}"
+
+        logger.info("Slack notification sent successfully: %s", response.data.decode('utf-8'))
+        return "sent"
+
+    except urllib3.exceptions.HTTPError as e:
+        logger.error("Slack connection error: %s", e)
+        return f"failed: {str(e)}"
     except Exception as e:
-        logger.error(f"Slack notification error: {e}")
+        logger.error("Slack notification error: %s", e)
         return f"failed: {str(e)}"
@@ -25,6 +25,12 @@ variable "enable_slack" {
   default     = false
 }
 
+variable "notification_queue_arn" {
+  description = "ARN of the SQS queue buffering notifications (optional; enables the batched queue trigger)"
+  type        = string
+  default     = ""
+}
+
 variable "tags" {
   description = "Tags to apply to all resources"
   type        = map(string)
@@ -23,12 +23,14 @@ resource "aws_lambda_function" "policy_engine" {
 
   environment {
     variables = {
-      DYNAMODB_TABLE      = var.dynamodb_table_name
-      EXCEPTIONS_TABLE    = var.exceptions_table_name
-      REMEDIATION_LAMBDA  = var.remediation_lambda_arn
-      NOTIFICATION_LAMBDA = var.notification_lambda_arn
-      ENVIRONMENT         = var.environment
-      LOG_LEVEL           = var.log_level
+      DYNAMODB_TABLE       = var.dynamodb_table_name
+      EXCEPTIONS_TABLE     = var.exceptions_table_name
+      REMEDIATION_LAMBDA   = var.remediation_lambda_arn
+      NOTIFICATION_LAMBDA  = var.notification_lambda_arn
+      SNS_TOPIC_ARN        = var.sns_topic_arn
+      COMPLIANCE_QUEUE_URL = var.compliance_queue_url
+      ENVIRONMENT          = var.environment
+      LOG_LEVEL            = var.log_level
     }
   }
 
@@ -51,6 +53,7 @@ resource "aws_lambda_function" "policy_engine" {
 data "archive_file" "policy_engine" {
   type        = "zip"
   source_dir  = "${path.module}/src"
+  excludes    = ["__pycache__"]
   output_path = "${path.module}/dist/policy_engine.zip"
 }
 
@@ -100,6 +103,7 @@ data "aws_iam_policy_document" "dynamodb_access" {
     effect = "Allow"
     actions = [
       "dynamodb:PutItem",
+      "dynamodb:BatchWriteItem",
       "dynamodb:GetItem",
       "dynamodb:Query",
       "dynamodb:UpdateItem"
@@ -145,3 +149,48 @@ data "aws_iam_policy_document" "lambda_invoke" {
     ])
   }
 }
+
+# Buffer queue for async compliance history persistence (optional)
+resource "aws_iam_role_policy" "policy_engine_sqs" {
+  count  = var.compliance_queue_arn != "" ? 1 : 0
+  name   = "${var.name_prefix}-policy-engine-sqs"
+  role   = aws_iam_role.policy_engine.id
+  policy = data.aws_iam_policy_document.sqs_buffer[0].json
+}
+
+data "aws_iam_policy_document" "sqs_buffer" {
+  count = var.compliance_queue_arn != "" ? 1 : 0
+
+  statement {
+    sid    = "SQSBuffer"
+    effect = "Allow"
+    actions = [
+      "sqs:SendMessage",
+      "sqs:ReceiveMessage",
+      "sqs:DeleteMessage",
+      "sqs:GetQueueAttributes"
+    ]
+    resources = [var.compliance_queue_arn]
+  }
+}
+
+# Direct SNS publish for MEDIUM severity (optional, bypasses notification Lambda)
+resource "aws_iam_role_policy" "policy_engine_sns" {
+  count  = var.sns_topic_arn != "" ? 1 : 0
+  name   = "${var.name_prefix}-policy-engine-sns"
+  role   = aws_iam_role.policy_engine.id
+  policy = data.aws_iam_policy_document.sns_publish[0].json
+}
+
+data "aws_iam_policy_document" "sns_publish" {
+  count = var.sns_topic_arn != "" ? 1 : 0
+
+  statement {
+    sid    = "SNSPublish"
+    effect = "Allow"
+    actions = [
+      "sns:Publish"
+    ]
+    resources = [var.sns_topic_arn]
+  }
+}
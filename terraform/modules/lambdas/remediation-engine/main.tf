@@ -29,6 +29,7 @@ resource "aws_lambda_function" "remediation_engine" {
       ACCOUNT_ENVIRONMENT_MAP = jsonencode(var.account_environment_map)
       PROD_ACCOUNT_ID         = var.prod_account_id
       NOTIFICATION_LAMBDA     = var.notification_lambda_arn
+      NOTIFICATION_QUEUE_URL  = var.notification_queue_url
     }
   }
 
@@ -42,6 +43,7 @@ resource "aws_lambda_function" "remediation_engine" {
 data "archive_file" "remediation_engine" {
   type        = "zip"
   source_dir  = "${path.module}/src"
+  excludes    = ["__pycache__"]
   output_path = "${path.module}/dist/remediation_engine.zip"
 }
 
@@ -119,3 +121,25 @@ data "aws_iam_policy_document" "invoke_notification_lambda" {
   }
 }
 
+# Buffer queue for batched notification delivery (optional)
+resource "aws_iam_role_policy" "notification_queue" {
+  count = var.notification_queue_arn != "" ? 1 : 0
+
+  name   = "${var.name_prefix}-notification-queue"
+  role   = aws_iam_role.remediation_engine.id
+  policy = data.aws_iam_policy_document.notification_queue[0].json
+}
+
+data "aws_iam_policy_document" "notification_queue" {
+  count = var.notification_queue_arn != "" ? 1 : 0
+
+  statement {
+    sid    = "NotificationQueueSend"
+    effect = "Allow"
+    actions = [
+      "sqs:SendMessage"
+    ]
+    resources = [var.notification_queue_arn]
+  }
+}
+
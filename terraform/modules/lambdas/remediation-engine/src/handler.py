@@ -16,14 +16,37 @@ Safety Guardrails:
 - Environment-aware default tagging based on account ID
 """
 
+import base64
+import gzip
 import json
 import logging
 import os
+import time
 import boto3
+from botocore.config import Config
 from botocore.exceptions import ClientError
+
+# orjson arrives via a Lambda layer; serialization falls back to stdlib json
+try:
+    import orjson
+except ImportError:
+    orjson = None
 from typing import Any, Dict, List
-from urllib.request import Request, urlopen
-from urllib.error import URLError
+
+
+def _dumps(obj: Any) -> str:
+    """JSON-encode through orjson when the layer provides it."""
+    if orjson is not None:
+        return orjson.dumps(obj).decode("utf-8")
+    return json.dumps(obj)
+
+
+def _loads(data: Any) -> Any:
+    """JSON-decode through orjson when the layer provides it."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
 
 # Configure logging
 log_level = os.environ.get("LOG_LEVEL", "INFO")
@@ -34,13 +57,20 @@ logger.setLevel(getattr(logging, log_level))
 REMEDIATION_ROLE_NAME = os.environ.get("REMEDIATION_ROLE_NAME", "CloudGovernanceRemediationRole")
 EXTERNAL_ID = os.environ.get("EXTERNAL_ID", "CloudGovernance-Remediation-2024")
 NOTIFICATION_LAMBDA = os.environ.get("NOTIFICATION_LAMBDA", "")
+NOTIFICATION_QUEUE_URL = os.environ.get("NOTIFICATION_QUEUE_URL", "")
 
 # Account to Environment mapping (passed via environment variable)
-ACCOUNT_ENVIRONMENT_MAP = json.loads(os.environ.get("ACCOUNT_ENVIRONMENT_MAP", "{}"))
+ACCOUNT_ENVIRONMENT_MAP = _loads(os.environ.get("ACCOUNT_ENVIRONMENT_MAP", "{}"))
 
 # Production account ID for safety checks
 PROD_ACCOUNT_ID = os.environ.get("PROD_ACCOUNT_ID", "")
 
+# All accounts the prod safety check must treat as production, folded into
+# one set so the per-invocation check is a single membership test
+PROD_ACCOUNT_IDS = frozenset(
+    account_id for account_id, env in ACCOUNT_ENVIRONMENT_MAP.items() if env == "prod"
+) | ({PROD_ACCOUNT_ID} if PROD_ACCOUNT_ID else set())
+
 # Environment-specific default tags
 DEFAULT_TAGS_BY_ENV = {
     "dev": {
@@ -89,19 +119,117 @@ DEFAULT_TAGS_FALLBACK = {
     "ManagedBy": "Terraform"
 }
 
-STS_CLIENT = boto3.client("sts")
-LAMBDA_CLIENT = boto3.client("lambda")
+# AWS tagging APIs want list-of-{Key,Value} dicts; the per-environment maps
+# are immutable module data, so materialize that form once at import instead
+# of rebuilding it on every required-tags remediation
+DEFAULT_TAGS_BY_ENV_LIST = {
+    env: tuple({"Key": k, "Value": v} for k, v in tag_dict.items())
+    for env, tag_dict in DEFAULT_TAGS_BY_ENV.items()
+}
+DEFAULT_TAGS_FALLBACK_LIST = tuple(
+    {"Key": k, "Value": v} for k, v in DEFAULT_TAGS_FALLBACK.items()
+)
+
+# TCP keepalive lets warm invocations reuse established TLS connections to
+# STS and Lambda instead of re-handshaking on every remediation
+_BOTO_CFG = Config(
+    tcp_keepalive=True,
+    max_pool_connections=50,
+    retries={"mode": "adaptive", "max_attempts": 10},
+    connect_timeout=3,
+    read_timeout=10,
+)
+
+STS_CLIENT = boto3.client("sts", config=_BOTO_CFG)
+LAMBDA_CLIENT = boto3.client("lambda", config=_BOTO_CFG)
+
+# Notifications go through SQS when a queue is configured; the queue's
+# Lambda trigger batches messages so the notification function amortizes
+# cold starts and the prod-safety path returns without an invoke round trip
+sqs_client = boto3.client("sqs", config=_BOTO_CFG) if NOTIFICATION_QUEUE_URL else None
+
+# Pre-load the service models the remediators build clients for on assumed
+# sessions, during the init phase that Lambda runs at full CPU and does not
+# bill to the first invocation
+if os.environ.get("INIT_WARMUP", "true").lower() == "true":
+    try:
+        _warmup_start = time.perf_counter()
+        for _service in ("s3", "ec2", "dynamodb", "lambda", "rds"):
+            boto3.client(_service, config=_BOTO_CFG)
+        logger.debug(
+            "Client warmup took %.1f ms", (time.perf_counter() - _warmup_start) * 1000
+        )
+    except Exception as e:  # Warmup is best-effort, never fail the import
+        logger.debug("Client warmup skipped: %s", e)
+
+# Rule name -> remediation callable with a uniform (session, data,
+# environment) signature; hash dispatch instead of an if/elif chain, and
+# new rules only need a new entry
+_REMEDIATORS = {
+    "s3-bucket-public-read-prohibited":
+        lambda session, data, env: remediate_s3_public_read(session, data["resource_id"]),
+    # Enforce BPA is always ON (same remediation as public-read)
+    "s3-bucket-level-public-access-prohibited":
+        lambda session, data, env: remediate_s3_public_read(session, data["resource_id"]),
+    "s3-bucket-public-write-prohibited":
+        lambda session, data, env: remediate_s3_public_read(session, data["resource_id"]),
+    "required-tags":
+        lambda session, data, env: remediate_required_tags(
+            session, data["resource_id"], data.get("resource_type", ""),
+            data["account_id"], env),
+    "restricted-ssh":
+        lambda session, data, env: remediate_security_group(
+            session, data["resource_id"], data["rule_name"]),
+    "restricted-rdp":
+        lambda session, data, env: remediate_security_group(
+            session, data["resource_id"], data["rule_name"]),
+}
+
+# CIDRs considered world-open; frozenset membership is O(1) per range check
+DANGEROUS_CIDRS_SET = frozenset(("0.0.0.0/0", "::/0"))
+
+# Full S3 Public Access Block configuration; constant, so built once
+_PAB_ALL_TRUE = {
+    'BlockPublicAcls': True,
+    'IgnorePublicAcls': True,
+    'BlockPublicPolicy': True,
+    'RestrictPublicBuckets': True
+}
+
+# Assumed-role sessions cached per (account, region) for the life of the
+# warm container; STS credentials stay valid for up to an hour, so repeat
+# remediations in the same account skip the AssumeRole round trip
+# Each entry is {"expires_at": epoch, "session": Session, "clients": {svc: client}}
+_SESSION_CACHE: Dict[tuple, dict] = {}
+_CREDS_EXPIRY_MARGIN = 300  # refresh when under 5 minutes of life remain
+_CREDS_DURATION = 3600  # ask STS for the full hour to maximize cache hits
+
+# Notification payloads above this size get gzip-wrapped; compliance data
+# with large annotations can otherwise creep toward the 256 KB async
+# invoke cap, and compressing tiny payloads would just waste CPU
+_COMPRESS_THRESHOLD = 32 * 1024
+
+
+class _LazyJSON:
+    """Defers JSON encoding until the log record is actually emitted."""
+
+    def __init__(self, obj: Any):
+        self.obj = obj
+
+    def __str__(self) -> str:
+        return _dumps(self.obj)
 
 
 def lambda_handler(event: dict, context: Any) -> dict:
     """
     Main entry point for remediation.
     """
-    logger.info(f"Received remediation request: {json.dumps(event)}")
-    
+    # _LazyJSON keeps the serialization cost out of the path unless DEBUG is on
+    logger.debug("Received remediation request: %s", _LazyJSON(event))
+
     action = event.get("action")
     if action != "remediate":
-        logger.warning(f"Unknown action: {action}")
+        logger.warning("Unknown action: %s", action)
         return {"statusCode": 400, "body": "Unknown action"}
     
     compliance_data = event.get("compliance_data", {})
@@ -109,54 +237,47 @@ def lambda_handler(event: dict, context: Any) -> dict:
     rule_name = compliance_data.get("rule_name")
     resource_id = compliance_data.get("resource_id")
     region = compliance_data.get("region")
-    resource_type = compliance_data.get("resource_type", "")
-    
+
     if not all([account_id, rule_name, resource_id, region]):
         logger.error("Missing required fields in compliance data")
         return {"statusCode": 400, "body": "Missing required fields"}
     
-    # Determine environment from account ID
-    environment = get_environment_for_account(account_id)
-    logger.info(f"Account {account_id} mapped to environment: {environment}")
-    
     # Production safety check for Security Group remediation
     if rule_name in ["restricted-ssh", "restricted-rdp"]:
         if is_production_account(account_id):
-            logger.warning(f"Security Group remediation blocked in production. Sending notification instead.")
+            logger.warning("Security Group remediation blocked in production. Sending notification instead.")
             notify_instead_of_remediate(compliance_data, "Production safety: SG remediation blocked")
             return {
                 "statusCode": 200,
-                "body": json.dumps({
+                "body": _dumps({
                     "message": "Production safety: Notification sent instead of remediation",
                     "rule_name": rule_name,
                     "account_id": account_id
                 })
             }
     
+    remediator = _REMEDIATORS.get(rule_name)
+    if remediator is None:
+        logger.warning("No remediation logic defined for rule: %s", rule_name)
+        return {"statusCode": 200, "body": f"No remediation defined for {rule_name}"}
+
+    # Determine environment from account ID; only needed once the request
+    # has cleared the prod-safety and known-rule checks
+    environment = get_environment_for_account(account_id)
+    logger.info("Account %s mapped to environment: %s", account_id, environment)
+
     try:
         # 1. Assume Role in Target Account
-        logger.info(f"Assuming role {REMEDIATION_ROLE_NAME} in account {account_id}")
+        logger.info("Assuming role %s in account %s", REMEDIATION_ROLE_NAME, account_id)
         session = assume_role(account_id, region)
-        
+
         # 2. Execute Remediation based on rule
-        if rule_name == "s3-bucket-public-read-prohibited":
-            remediate_s3_public_read(session, resource_id)
-        elif rule_name == "s3-bucket-level-public-access-prohibited":
-            # Enforce BPA is always ON (same remediation as public-read)
-            remediate_s3_public_read(session, resource_id)
-        elif rule_name == "s3-bucket-public-write-prohibited":
-            remediate_s3_public_write(session, resource_id)
-        elif rule_name == "required-tags":
-            remediate_required_tags(session, resource_id, resource_type, account_id, environment)
-        elif rule_name in ["restricted-ssh", "restricted-rdp"]:
-            remediate_security_group(session, resource_id, rule_name)
-        else:
-            logger.warning(f"No remediation logic defined for rule: {rule_name}")
-            return {"statusCode": 200, "body": f"No remediation defined for {rule_name}"}
-            
+        remediator(session, compliance_data, environment)
+
+
         return {
             "statusCode": 200,
-            "body": json.dumps({
+            "body": _dumps({
                 "message": f"Successfully remediated {rule_name} on {resource_id}",
                 "resource_id": resource_id,
                 "account_id": account_id,
@@ -165,10 +286,10 @@ def lambda_handler(event: dict, context: Any) -> dict:
         }
         
     except ClientError as e:
-        logger.error(f"AWS Error during remediation: {e}")
+        logger.error("AWS Error during remediation: %s", e)
         raise
     except Exception as e:
-        logger.error(f"Unexpected error: {e}", exc_info=True)
+        logger.error("Unexpected error: %s", e, exc_info=True)
         raise
 
 
@@ -183,22 +304,38 @@ def get_environment_for_account(account_id: str) -> str:
 def is_production_account(account_id: str) -> bool:
     """
     Check if an account is the production account.
+
+    Covers both the explicit PROD_ACCOUNT_ID and any account mapped to
+    'prod', precomputed into PROD_ACCOUNT_IDS at import.
     """
-    # Check via explicit PROD_ACCOUNT_ID env var
-    if PROD_ACCOUNT_ID and account_id == PROD_ACCOUNT_ID:
-        return True
-    # Check via account mapping
-    return get_environment_for_account(account_id) == "prod"
+    return account_id in PROD_ACCOUNT_IDS
+
+
+def _notify_payload(payload: dict) -> bytes:
+    """
+    Serialize a notification payload, gzip-wrapping it when large.
+
+    The notification Lambda unwraps the {"compressed": True, "data": ...}
+    envelope before processing.
+    """
+    body = (orjson.dumps(payload) if orjson is not None
+            else json.dumps(payload).encode("utf-8"))
+    if len(body) < _COMPRESS_THRESHOLD:
+        return body
+    return _dumps({
+        "compressed": True,
+        "data": base64.b64encode(gzip.compress(body)).decode("ascii")
+    }).encode("utf-8")
 
 
 def notify_instead_of_remediate(compliance_data: dict, reason: str) -> None:
     """
     Send a notification instead of remediating (for prod safety).
     """
-    if not NOTIFICATION_LAMBDA:
+    if not NOTIFICATION_LAMBDA and not NOTIFICATION_QUEUE_URL:
         logger.warning("Notification Lambda not configured, cannot notify")
         return
-    
+
     payload = {
         "action": "notify",
         "compliance_data": {
@@ -207,75 +344,115 @@ def notify_instead_of_remediate(compliance_data: dict, reason: str) -> None:
             "annotation": f"{reason}. Manual intervention required."
         }
     }
-    
+
+    # Preferred path: drop the message on the queue and let the trigger's
+    # batch window fan it into the notification Lambda
+    if NOTIFICATION_QUEUE_URL:
+        try:
+            sqs_client.send_message(
+                QueueUrl=NOTIFICATION_QUEUE_URL,
+                MessageBody=_notify_payload(payload).decode("utf-8")
+            )
+            logger.info("Queued notification instead of remediation: %s", reason)
+            return
+        except ClientError as e:
+            logger.error("Failed to queue notification, falling back to invoke: %s", e)
+            if not NOTIFICATION_LAMBDA:
+                return
+
     try:
         LAMBDA_CLIENT.invoke(
             FunctionName=NOTIFICATION_LAMBDA,
             InvocationType="Event",
-            Payload=json.dumps(payload)
+            Payload=_notify_payload(payload)
         )
-        logger.info(f"Sent notification instead of remediation: {reason}")
+        logger.info("Sent notification instead of remediation: %s", reason)
     except ClientError as e:
-        logger.error(f"Failed to invoke notification Lambda: {e}")
+        logger.error("Failed to invoke notification Lambda: %s", e)
 
 
 def assume_role(account_id: str, region: str) -> boto3.Session:
     """
     Assume the remediation role in the target account.
+
+    Sessions are cached per (account, region) and reused until shortly
+    before the STS credentials expire.
     """
+    cache_key = (account_id, region)
+    cached = _SESSION_CACHE.get(cache_key)
+    if cached and time.time() < cached["expires_at"] - _CREDS_EXPIRY_MARGIN:
+        logger.debug("Reusing cached session for account %s", account_id)
+        return cached["session"]
+
     role_arn = f"arn:aws:iam::{account_id}:role/{REMEDIATION_ROLE_NAME}"
-    
+
     try:
         response = STS_CLIENT.assume_role(
             RoleArn=role_arn,
             RoleSessionName="GovernanceRemediationEngine",
-            ExternalId=EXTERNAL_ID
+            ExternalId=EXTERNAL_ID,
+            DurationSeconds=_CREDS_DURATION
         )
-        
+
         credentials = response["Credentials"]
-        
-        return boto3.Session(
+
+        session = boto3.Session(
             aws_access_key_id=credentials["AccessKeyId"],
             aws_secret_access_key=credentials["SecretAccessKey"],
             aws_session_token=credentials["SessionToken"],
             region_name=region
         )
+        _SESSION_CACHE[cache_key] = _cache_entry(
+            credentials["Expiration"].timestamp(), session
+        )
+        return session
     except ClientError as e:
-        logger.error(f"Failed to assume role {role_arn}: {e}")
+        logger.error("Failed to assume role %s: %s", role_arn, e)
         raise
 
 
+def _cache_entry(expires_at: float, session: boto3.Session) -> dict:
+    """Build a session cache entry; the client memo rides along on the session."""
+    session._governance_clients = {}
+    return {"expires_at": expires_at, "session": session, "clients": session._governance_clients}
+
+
+def _session_client(session: boto3.Session, service: str):
+    """
+    Return a memoized client for this session.
+
+    Client construction (endpoint resolution, signer and model setup) is
+    pure Python overhead worth paying once per service per session.
+    """
+    clients = getattr(session, "_governance_clients", None)
+    if clients is None:
+        clients = {}
+        session._governance_clients = clients
+    client = clients.get(service)
+    if client is None:
+        client = session.client(service, config=_BOTO_CFG)
+        clients[service] = client
+    return client
+
+
 def remediate_s3_public_read(session: boto3.Session, bucket_name: str):
     """
     Remediate public read access on S3 bucket.
     """
-    logger.info(f"Remediating S3 public read on {bucket_name}")
-    s3 = session.client("s3")
+    logger.info("Remediating S3 public read on %s", bucket_name)
+    s3 = _session_client(session, "s3")
     
     try:
         s3.put_public_access_block(
             Bucket=bucket_name,
-            PublicAccessBlockConfiguration={
-                'BlockPublicAcls': True,
-                'IgnorePublicAcls': True,
-                'BlockPublicPolicy': True,
-                'RestrictPublicBuckets': True
-            }
+            PublicAccessBlockConfiguration=_PAB_ALL_TRUE
         )
-        logger.info(f"Enabled Public Access Block on {bucket_name}")
+        logger.info("Enabled Public Access Block on %s", bucket_name)
     except ClientError as e:
-        logger.error(f"Failed to enable S3 Public Access Block: {e}")
+        logger.error("Failed to enable S3 Public Access Block: %s", e)
         raise
 
 
-def remediate_s3_public_write(session: boto3.Session, bucket_name: str):
-    """
-    Remediate public write access on S3 bucket (same as public read).
-    """
-    logger.info(f"Remediating S3 public write on {bucket_name}")
-    remediate_s3_public_read(session, bucket_name)
-
-
 def remediate_security_group(session: boto3.Session, security_group_id: str, rule_name: str):
     """
     Remediate security group by revoking dangerous ingress rules.
@@ -283,71 +460,59 @@ def remediate_security_group(session: boto3.Session, security_group_id: str, rul
     For restricted-ssh: Revoke rules allowing 0.0.0.0/0 on port 22
     For restricted-rdp: Revoke rules allowing 0.0.0.0/0 on port 3389
     """
-    logger.info(f"Remediating security group {security_group_id} for rule {rule_name}")
-    ec2 = session.client("ec2")
+    logger.info("Remediating security group %s for rule %s", security_group_id, rule_name)
+    ec2 = _session_client(session, "ec2")
     
     # Determine which port to check based on rule
     target_port = 22 if rule_name == "restricted-ssh" else 3389
-    dangerous_cidrs = ["0.0.0.0/0", "::/0"]
-    
+
     try:
-        # Get current security group rules
-        response = ec2.describe_security_groups(GroupIds=[security_group_id])
-        
-        if not response.get("SecurityGroups"):
-            logger.warning(f"Security group {security_group_id} not found")
-            return
-        
-        sg = response["SecurityGroups"][0]
+        # The flat rules API returns one compact entry per rule - no group
+        # metadata or nested permission blocks to fetch and parse - and each
+        # entry carries the rule ID needed for a revoke-by-ID call
+        response = ec2.describe_security_group_rules(
+            Filters=[{"Name": "group-id", "Values": [security_group_id]}]
+        )
+
         rules_to_revoke = []
-        
-        for rule in sg.get("IpPermissions", []):
-            # Check if this rule applies to the target port
-            from_port = rule.get("FromPort", 0)
-            to_port = rule.get("ToPort", 0)
-            
-            # Check if target port is within the range
+
+        for rule in response.get("SecurityGroupRules", []):
+            if rule.get("IsEgress"):
+                continue
+
+            # Check if target port is within the rule's range
+            from_port = rule.get("FromPort")
+            to_port = rule.get("ToPort")
             if from_port is not None and to_port is not None:
                 if not (from_port <= target_port <= to_port):
                     continue
-            
-            # Check for dangerous IP ranges
-            for ip_range in rule.get("IpRanges", []):
-                if ip_range.get("CidrIp") in dangerous_cidrs:
-                    rules_to_revoke.append({
-                        "IpProtocol": rule.get("IpProtocol", "tcp"),
-                        "FromPort": from_port,
-                        "ToPort": to_port,
-                        "IpRanges": [{"CidrIp": ip_range.get("CidrIp")}]
-                    })
-                    logger.info(f"Found dangerous rule: {ip_range.get('CidrIp')} on port {target_port}")
-            
-            # Check for IPv6 ranges
-            for ip_range in rule.get("Ipv6Ranges", []):
-                if ip_range.get("CidrIpv6") in dangerous_cidrs:
-                    rules_to_revoke.append({
-                        "IpProtocol": rule.get("IpProtocol", "tcp"),
-                        "FromPort": from_port,
-                        "ToPort": to_port,
-                        "Ipv6Ranges": [{"CidrIpv6": ip_range.get("CidrIpv6")}]
-                    })
-                    logger.info(f"Found dangerous IPv6 rule: {ip_range.get('CidrIpv6')} on port {target_port}")
-        
-        # Revoke the dangerous rules
+
+            cidr = rule.get("CidrIpv4") or rule.get("CidrIpv6")
+            if cidr in DANGEROUS_CIDRS_SET:
+                rules_to_revoke.append(rule)
+
+        # Revoke the dangerous rules; the API takes the whole ID list, so
+        # one call covers every rule instead of one round trip each
         if rules_to_revoke:
             for rule in rules_to_revoke:
-                ec2.revoke_security_group_ingress(
-                    GroupId=security_group_id,
-                    IpPermissions=[rule]
+                logger.info(
+                    "Revoking ingress rule %s from %s (%s ports %s-%s)",
+                    rule.get("SecurityGroupRuleId"), security_group_id,
+                    rule.get("CidrIpv4") or rule.get("CidrIpv6"),
+                    rule.get("FromPort"), rule.get("ToPort")
                 )
-                logger.info(f"Revoked ingress rule from {security_group_id}: {json.dumps(rule)}")
-            
-            logger.info(f"Successfully remediated {len(rules_to_revoke)} rules on {security_group_id}")
+
+            ec2.revoke_security_group_ingress(
+                GroupId=security_group_id,
+                SecurityGroupRuleIds=[r["SecurityGroupRuleId"] for r in rules_to_revoke]
+            )
+
+            logger.info("Successfully remediated %d rules on %s", len(rules_to_revoke), security_group_id)
         else:
-            logger.info(f"No dangerous rules found on {security_group_id} for port {target_port}")
+            logger.info("No dangerous rules found on %s for port %s", security_group_id, target_port)
             
     except ClientError as e:
-        logger.error(f"Failed to remediate security group {security_group_id}: {e}")
+        logger.error("Failed to remediate security group %s: %s", security_group_id, e)
         raise
 
 
@@ -356,13 +521,98 @@ def get_tags_for_environment(environment: str) -> List[Dict[str, str]]:
     Get the default tags for a specific environment.
     Returns a list of tag dicts suitable for AWS APIs.
     """
-    tag_dict = DEFAULT_TAGS_BY_ENV.get(environment, DEFAULT_TAGS_FALLBACK)
-    return [{"Key": k, "Value": v} for k, v in tag_dict.items()]
+    # Copy to a list so callers can safely mutate the result
+    return list(DEFAULT_TAGS_BY_ENV_LIST.get(environment, DEFAULT_TAGS_FALLBACK_LIST))
+
+
+def _tag_ec2_instance(session: boto3.Session, resource_id: str,
+                      tags_to_add: List[Dict[str, str]], account_id: str) -> None:
+    ec2 = _session_client(session, "ec2")
+    # EC2 create_tags merges by default, won't overwrite existing
+    ec2.create_tags(Resources=[resource_id], Tags=tags_to_add)
+    logger.info("Added tags to EC2 instance %s", resource_id)
+
+
+def _tag_s3_bucket(session: boto3.Session, resource_id: str,
+                   tags_to_add: List[Dict[str, str]], account_id: str) -> None:
+    s3 = _session_client(session, "s3")
+    # S3 tagging replaces all tags, so fetch existing ones first
+    try:
+        current_tags = s3.get_bucket_tagging(Bucket=resource_id).get('TagSet', [])
+    except ClientError as e:
+        if "NoSuchTagSet" in str(e):
+            current_tags = []
+        else:
+            raise
+
+    # Merge tags (don't overwrite existing keys); setdefault keeps existing
+    # values and insertion order without a separate key-set pass
+    merged = {t['Key']: t['Value'] for t in current_tags}
+    for tag in tags_to_add:
+        merged.setdefault(tag['Key'], tag['Value'])
+
+    # Fast path: everything already tagged, skip the PUT round trip
+    if len(merged) == len(current_tags):
+        logger.info("S3 bucket %s already has all required tags", resource_id)
+        return
+
+    s3.put_bucket_tagging(
+        Bucket=resource_id,
+        Tagging={'TagSet': [{'Key': k, 'Value': v} for k, v in merged.items()]}
+    )
+    logger.info("Added tags to S3 bucket %s", resource_id)
+
+
+def _tag_dynamodb_table(session: boto3.Session, resource_id: str,
+                        tags_to_add: List[Dict[str, str]], account_id: str) -> None:
+    ddb = _session_client(session, "dynamodb")
+    # The caller already knows the target account; no need to ask STS
+    resource_arn = f"arn:aws:dynamodb:{session.region_name}:{account_id}:table/{resource_id}"
+
+    ddb.tag_resource(ResourceArn=resource_arn, Tags=tags_to_add)
+    logger.info("Added tags to DynamoDB table %s", resource_id)
+
+
+def _tag_lambda_function(session: boto3.Session, resource_id: str,
+                         tags_to_add: List[Dict[str, str]], account_id: str) -> None:
+    lambda_client = _session_client(session, "lambda")
+    # Lambda tag_resource uses a dict, not list
+    tag_dict = {t['Key']: t['Value'] for t in tags_to_add}
+    lambda_client.tag_resource(Resource=resource_id, Tags=tag_dict)
+    logger.info("Added tags to Lambda function %s", resource_id)
+
+
+def _tag_rds_instance(session: boto3.Session, resource_id: str,
+                      tags_to_add: List[Dict[str, str]], account_id: str) -> None:
+    rds = _session_client(session, "rds")
+    # RDS uses add_tags_to_resource
+    rds.add_tags_to_resource(ResourceName=resource_id, Tags=tags_to_add)
+    logger.info("Added tags to RDS instance %s", resource_id)
+
+
+def _tag_security_group(session: boto3.Session, resource_id: str,
+                        tags_to_add: List[Dict[str, str]], account_id: str) -> None:
+    ec2 = _session_client(session, "ec2")
+    ec2.create_tags(Resources=[resource_id], Tags=tags_to_add)
+    logger.info("Added tags to Security Group %s", resource_id)
+
+
+# Config resource type -> tagging function with a uniform (session,
+# resource_id, tags_to_add, account_id) signature; same hash-dispatch
+# shape as _REMEDIATORS
+_TAG_HANDLERS = {
+    "AWS::EC2::Instance": _tag_ec2_instance,
+    "AWS::S3::Bucket": _tag_s3_bucket,
+    "AWS::DynamoDB::Table": _tag_dynamodb_table,
+    "AWS::Lambda::Function": _tag_lambda_function,
+    "AWS::RDS::DBInstance": _tag_rds_instance,
+    "AWS::EC2::SecurityGroup": _tag_security_group,
+}
 
 
 def remediate_required_tags(
-    session: boto3.Session, 
-    resource_id: str, 
+    session: boto3.Session,
+    resource_id: str,
     resource_type: str,
     account_id: str,
     environment: str
@@ -370,63 +620,15 @@ def remediate_required_tags(
     """
     Add environment-aware default tags for missing required tags.
     """
-    logger.info(f"Remediating missing tags on {resource_id} ({resource_type}) in {environment} environment")
-    
+    logger.info("Remediating missing tags on %s (%s) in %s environment", resource_id, resource_type, environment)
+
+    handler = _TAG_HANDLERS.get(resource_type)
+    if handler is None:
+        logger.warning("Tag remediation not implemented for resource type: %s", resource_type)
+        return
+
     # Get environment-specific tags
     tags_to_add = get_tags_for_environment(environment)
-    logger.info(f"Using tags for environment '{environment}': {json.dumps(tags_to_add)}")
-    
-    if resource_type == "AWS::EC2::Instance":
-        ec2 = session.client("ec2")
-        # EC2 create_tags merges by default, won't overwrite existing
-        ec2.create_tags(Resources=[resource_id], Tags=tags_to_add)
-        logger.info(f"Added tags to EC2 instance {resource_id}")
-    
-    elif resource_type == "AWS::S3::Bucket":
-        s3 = session.client("s3")
-        # S3 tagging replaces all tags, so fetch existing ones first
-        try:
-            current_tags = s3.get_bucket_tagging(Bucket=resource_id).get('TagSet', [])
-        except ClientError as e:
-            if "NoSuchTagSet" in str(e):
-                current_tags = []
-            else:
-                raise
-        
-        # Merge tags (don't overwrite existing keys)
-        existing_keys = {t['Key'] for t in current_tags}
-        new_tags = current_tags + [t for t in tags_to_add if t['Key'] not in existing_keys]
-        
-        s3.put_bucket_tagging(Bucket=resource_id, Tagging={'TagSet': new_tags})
-        logger.info(f"Added tags to S3 bucket {resource_id}")
-
-    elif resource_type == "AWS::DynamoDB::Table":
-        ddb = session.client("dynamodb")
-        sts = session.client("sts")
-        caller_account_id = sts.get_caller_identity()["Account"]
-        region = session.region_name
-        resource_arn = f"arn:aws:dynamodb:{region}:{caller_account_id}:table/{resource_id}"
-        
-        ddb.tag_resource(ResourceArn=resource_arn, Tags=tags_to_add)
-        logger.info(f"Added tags to DynamoDB table {resource_id}")
-    
-    elif resource_type == "AWS::Lambda::Function":
-        lambda_client = session.client("lambda")
-        # Lambda tag_resource uses a dict, not list
-        tag_dict = {t['Key']: t['Value'] for t in tags_to_add}
-        lambda_client.tag_resource(Resource=resource_id, Tags=tag_dict)
-        logger.info(f"Added tags to Lambda function {resource_id}")
-    
-    elif resource_type == "AWS::RDS::DBInstance":
-        rds = session.client("rds")
-        # RDS uses add_tags_to_resource
-        rds.add_tags_to_resource(ResourceName=resource_id, Tags=tags_to_add)
-        logger.info(f"Added tags to RDS instance {resource_id}")
-    
-    elif resource_type == "AWS::EC2::SecurityGroup":
-        ec2 = session.client("ec2")
-        ec2.create_tags(Resources=[resource_id], Tags=tags_to_add)
-        logger.info(f"Added tags to Security Group {resource_id}")
-        
-    else:
-        logger.warning(f"Tag remediation not implemented for resource type: {resource_type}")
+    logger.info("Using tags for environment '%s': %s", environment, _LazyJSON(tags_to_add))
+
+    handler(session, resource_id, tags_to_add, account_id)
@@ -41,6 +41,18 @@ variable "notification_lambda_arn" {
   default     = ""
 }
 
+variable "notification_queue_url" {
+  description = "SQS queue buffering prod-safety notifications (optional; direct Lambda invoke when unset)"
+  type        = string
+  default     = ""
+}
+
+variable "notification_queue_arn" {
+  description = "ARN of the notification buffer queue"
+  type        = string
+  default     = ""
+}
+
 variable "tags" {
   description = "Tags to apply to all resources"
   type        = map(string)
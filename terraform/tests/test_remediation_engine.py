@@ -2,6 +2,8 @@
 import json
 import os
 import sys
+from datetime import datetime, timedelta, timezone
+
 import pytest
 from unittest.mock import MagicMock, patch
 
@@ -25,7 +27,8 @@ def mock_sts():
             "Credentials": {
                 "AccessKeyId": "ASIA...",
                 "SecretAccessKey": "secret",
-                "SessionToken": "token"
+                "SessionToken": "token",
+                "Expiration": datetime.now(timezone.utc) + timedelta(hours=1)
             }
         }
         yield mock_sts
@@ -57,7 +60,8 @@ def test_remediate_s3_public_read(mock_env, mock_sts, mock_s3_session):
     mock_sts.assume_role.assert_called_with(
         RoleArn="arn:aws:iam::123456789012:role/TestRole",
         RoleSessionName="GovernanceRemediationEngine",
-        ExternalId="TestID"
+        ExternalId="TestID",
+        DurationSeconds=3600
     )
     
     # Verify S3 PutPublicAccessBlock